@@ -1,3 +1,7 @@
+import asyncio
+from typing import Any, Mapping, Optional
+
+import orjson
 from fastapi import APIRouter, Depends, Request, HTTPException, Response
 
 from app.models.query import (
@@ -19,6 +23,26 @@ logger = logging.getLogger("temporallayr.api.query")
 router = APIRouter(tags=["Querying"])
 
 
+def _orjson_default(value: Any) -> Any:
+    # Row mappings from the listing queries; every field inside is orjson-native
+    if isinstance(value, Mapping):
+        return dict(value)
+    raise TypeError
+
+
+def _json_response(content: Any) -> Response:
+    """Encode a listing straight to JSON bytes, skipping FastAPI's jsonable_encoder walk.
+
+    orjson renders datetimes and UUIDs itself, so rows need no per-field conversion.
+    """
+    return Response(
+        content=orjson.dumps(
+            content, default=_orjson_default, option=orjson.OPT_NON_STR_KEYS
+        ),
+        media_type="application/json",
+    )
+
+
 def get_storage_service():
     from app.services.storage_service import StorageService
 
@@ -109,15 +133,17 @@ async def get_executions(
     tenant_id: str,
     limit: int = 50,
     offset: int = 0,
+    cursor: Optional[str] = None,
     api_key=Depends(verify_api_key),
     storage=Depends(get_storage_service),
 ):
     try:
         print(f"[INDEX QUERY] tenant={tenant_id} offset={offset}")
+        # Prefer cursor (the previous page's next_cursor); offset remains for old clients
         result = await storage.list_executions(
-            tenant_id=tenant_id, limit=limit, offset=offset
+            tenant_id=tenant_id, limit=limit, offset=offset, cursor=cursor
         )
-        return result
+        return _json_response(result)
     except Exception as e:
         logger.error(f"[QUERY] Error in get_executions: {str(e)}")
         return {"results": [], "total": 0}
@@ -143,6 +169,37 @@ async def search_executions(
     if limit > 1000:
         limit = 1000
 
+    # Payload text and custom key filters need the raw events; every other search is
+    # answered from the execution summaries (node_names index, keyset cursor)
+    if payload.contains or payload.filters:
+        return await _search_event_payloads(tenant_id, payload, limit)
+
+    from app.services.search import search_executions as search_summaries
+    from app.services.search import search_next_cursor
+
+    try:
+        # Prefer cursor (the previous page's next_cursor); offset remains for old clients
+        results = await search_summaries(
+            tenant_id=tenant_id,
+            function_name=payload.function_name,
+            start_time=payload.start_time,
+            end_time=payload.end_time,
+            limit=limit,
+            offset=payload.offset,
+            cursor=payload.cursor,
+        )
+        return {
+            "results": results,
+            "next_cursor": search_next_cursor(results, limit),
+        }
+    except Exception as e:
+        logger.error(f"[QUERY] Error in search_executions: {str(e)}")
+        return {"results": [], "next_cursor": None}
+
+
+async def _search_event_payloads(
+    tenant_id: str, payload: SearchRequest, limit: int
+) -> dict:
     from app.core.database import async_session_maker
     from sqlalchemy import select, text, desc
 
@@ -166,13 +223,13 @@ async def search_executions(
                 )
 
             # New Feature: Deep ILIKE full-text search bypassing ORM bounds mapping GIN
-            if hasattr(payload, "contains") and payload.contains:
+            if payload.contains:
                 contains_str = payload.contains.replace("'", "''")  # basic safety
                 # Cast JSONB to text natively scanning values safely leveraging structural extensions
                 stmt = stmt.where(text(f"payload::text ILIKE '%{contains_str}%'"))
 
             # New Feature: Additional nested custom filter keys scanning safely
-            if hasattr(payload, "filters") and payload.filters:
+            if payload.filters:
                 for key, val in payload.filters.items():
                     if val is not None:
                         stmt = stmt.where(Event.payload.op("->>")(key) == str(val))
@@ -204,6 +261,7 @@ async def get_incidents(
     request: Request,
     limit: int = 50,
     offset: int = 0,
+    cursor: Optional[str] = None,
     api_key: str = Depends(verify_api_key),
     storage=Depends(get_storage_service),
 ):
@@ -212,9 +270,14 @@ async def get_incidents(
         print(f"[INCIDENTS QUERY] tenant={tenant_id} limit={limit} offset={offset}")
 
         results = await storage.list_incidents(
-            tenant_id=tenant_id, limit=limit, offset=offset
+            tenant_id=tenant_id, limit=limit, offset=offset, cursor=cursor
+        )
+        return _json_response(
+            {
+                "incidents": results,
+                "next_cursor": storage.incidents_next_cursor(results, limit),
+            }
         )
-        return {"incidents": results}
     except Exception as e:
         logger.error(f"[QUERY] Error in get_incidents: {str(e)}")
         return {"incidents": []}
@@ -234,7 +297,7 @@ async def create_alert(
             f"[ALERT CREATION] tenant={tenant_id} name={payload.name} webhook={webhook_str}"
         )
 
-        success = await storage.create_alert_rule(
+        rule_id = await storage.create_alert_rule(
             tenant_id=tenant_id,
             name=payload.name,
             failure_type=payload.failure_type,
@@ -242,13 +305,16 @@ async def create_alert(
             webhook_url=webhook_str,
         )
 
-        if not success:
+        if not rule_id:
             return {
                 "status": "error",
                 "message": "Failed persisting alert rule constraint.",
             }
 
-        return {"status": "ok"}
+        from app.services.alert_engine import invalidate_alert_rules
+
+        await invalidate_alert_rules(tenant_id)
+        return {"status": "ok", "id": rule_id}
     except Exception as e:
         logger.error(f"[QUERY] Error in create_alert: {str(e)}")
         return {"status": "error", "message": str(e)}
@@ -364,11 +430,14 @@ async def diff_executions(
         print(f"[DIFF] comparing {payload.execution_a} vs {payload.execution_b}")
         tenant_id = payload.tenant_id
 
-        exec_a = await storage.get_execution(
-            tenant_id=tenant_id, execution_id=payload.execution_a
-        )
-        exec_b = await storage.get_execution(
-            tenant_id=tenant_id, execution_id=payload.execution_b
+        # Independent lookups on separate pooled connections: run them side by side
+        exec_a, exec_b = await asyncio.gather(
+            storage.get_execution(
+                tenant_id=tenant_id, execution_id=payload.execution_a
+            ),
+            storage.get_execution(
+                tenant_id=tenant_id, execution_id=payload.execution_b
+            ),
         )
 
         if not exec_a or not exec_b:
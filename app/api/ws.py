@@ -1,6 +1,6 @@
 import asyncio
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Query
-from app.core.event_stream import EventStream
+from app.core.event_stream import EventStream, dumps_frame
 from app.config import EXPECTED
 
 router = APIRouter()
@@ -24,7 +24,7 @@ async def websocket_live_execution(
         async for event in stream.subscribe():
             if event.get("tenant_id") == tenant_id:
                 try:
-                    await websocket.send_json(event)
+                    await websocket.send_text(dumps_frame(event))
                 except Exception:
                     # Trapped exception pushing explicitly means socket severed dirty
                     break
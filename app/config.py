@@ -23,6 +23,20 @@ else:
         "No DATABASE_URL or DATABASE_PUBLIC_URL provided. App will degrade gracefully."
     )
 
+# Optional streaming read replica serving read-only query/analytics traffic
+DATABASE_READ_URL = os.environ.get("DATABASE_READ_URL")
+if DATABASE_READ_URL:
+    logger.info("Read replica URL configured; query engine reads will use it.")
+
+# Per-connection LRU of server-side prepared statements kept by the asyncpg adapter
+DB_PREPARED_STATEMENT_CACHE_SIZE = int(
+    os.environ.get("DB_PREPARED_STATEMENT_CACHE_SIZE", "500")
+)
+
+# Set when DATABASE_URL points at PgBouncer in transaction pooling mode, where a
+# prepared statement cannot outlive the transaction that created it
+DB_PGBOUNCER = os.environ.get("DB_PGBOUNCER", "").lower() in ("1", "true", "yes")
+
 PORT = int(os.environ.get("PORT", "8000"))
 logger.info(f"PORT configured: {PORT}")
 
@@ -44,6 +58,9 @@ def log_environment_status():
     vars_to_check = [
         "DATABASE_URL",
         "DATABASE_PUBLIC_URL",
+        "DATABASE_READ_URL",
+        "DB_PREPARED_STATEMENT_CACHE_SIZE",
+        "DB_PGBOUNCER",
         "PORT",
         "API_KEY",
         "TEMPORALLAYR_DEMO_API_KEY",
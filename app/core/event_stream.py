@@ -1,15 +1,30 @@
 import asyncio
-from typing import Any, AsyncGenerator
+from typing import Any, AsyncGenerator, List
+
+import orjson
 
 # Fan-out pub/sub: each subscriber gets its own queue.
 # Events published here are broadcast to ALL active subscribers independently.
 _subscribers: list[asyncio.Queue] = []
 
 
+# Non-str keys are stringified the way json.dumps would rather than raising
+_FRAME_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def dumps_frame(event: Any) -> str:
+    """Serialize a WebSocket frame with orjson (Rust) instead of json.dumps.
+
+    Returned as str so frames stay text frames for browser clients.
+    """
+    return orjson.dumps(event, option=_FRAME_OPTIONS).decode()
+
+
 class EventStream:
     """Async fan-out pub/sub event stream.
 
     publish() broadcasts to every connected subscriber.
+    publish_many() broadcasts a whole batch without per-event awaits.
     subscribe() registers a per-client queue and yields events forever.
     When the subscriber exits (e.g., WebSocket disconnect), its queue is
     automatically removed — no memory leaks, no server crashes.
@@ -19,7 +34,14 @@ class EventStream:
         """Broadcast an event to all active subscribers."""
         for q in list(_subscribers):  # snapshot to avoid mutation during iteration
             await q.put(event)
-        print("[STREAM] event published")
+
+    async def publish_many(self, events: List[Any]) -> None:
+        """Broadcast a batch of events to all active subscribers in one pass."""
+        if not events:
+            return
+        for q in list(_subscribers):
+            for event in events:
+                q.put_nowait(event)  # subscriber queues are unbounded
 
     async def subscribe(self) -> AsyncGenerator[Any, None]:
         """Async generator: register a subscriber queue, yield events, clean up on exit."""
@@ -1,9 +1,32 @@
 import uuid
-from sqlalchemy import Column, String, DateTime, Index, Integer, func
-from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy import (
+    DDL,
+    Column,
+    Computed,
+    String,
+    Text,
+    DateTime,
+    Index,
+    Integer,
+    event,
+    func,
+    text,
+)
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR, UUID
+from sqlalchemy.orm import deferred
 
 from app.core.database import Base
 
+# Inlined literal shared by ix_events_status_failed and the queries it serves: the planner
+# only uses a partial index when the query predicate matches it, which a bind parameter
+# (under generic prepared-statement plans) cannot prove.
+FAILED_STATUS_PREDICATE = text("(payload ->> 'status') = 'FAILED'")
+
+# Payload characters fed to payload_tsv. Lexeme text, entry headers and positions add up
+# to under 9 bytes of tsvector per input character in the worst case (multi-byte text
+# split into one-character words), so the result stays below Postgres' 1MB cap.
+TSV_SOURCE_CHARS = 100_000
+
 
 class Event(Base):
     """Production telemetry event mapping structural storage backend tables natively."""
@@ -18,14 +41,79 @@ class Event(Base):
     )
     payload = Column(JSONB, nullable=False)
 
+    # Stored lowercase rendering of the payload backing substring search; deferred so
+    # regular event loads never pull the duplicated text across the wire
+    payload_search = deferred(
+        Column(Text, Computed("lower(payload::text)", persisted=True))
+    )
+    # Word-level lexemes for multi-word phrase search; far smaller than the trigram index.
+    # Built from a bounded prefix: Postgres rejects tsvectors over 1MB, and as a stored
+    # column that error would fail the whole batch carrying one oversized payload
+    payload_tsv = deferred(
+        Column(
+            TSVECTOR,
+            Computed(
+                f"to_tsvector('simple', left(payload::text, {TSV_SOURCE_CHARS}))",
+                persisted=True,
+            ),
+        )
+    )
+
+    # Graph size computed once by Postgres at write time, mirroring the ingest rule: a
+    # missing "nodes" key counts 0, a non-array value 1 (jsonb_array_length rejects those)
+    node_count = Column(
+        Integer,
+        Computed(
+            "CASE WHEN payload -> 'nodes' IS NULL THEN 0 "
+            "WHEN jsonb_typeof(payload -> 'nodes') = 'array' "
+            "THEN jsonb_array_length(payload -> 'nodes') ELSE 1 END",
+            persisted=True,
+        ),
+    )
+
     # Composite indexes optimizing multi-tenant temporal slice scans naturally
     # Plus GIN index supporting deep JSON payload traversing natively
     __table_args__ = (
-        Index("idx_events_tenant_time", "tenant_id", timestamp.desc()),
-        Index("ix_events_payload_gin", "payload", postgresql_using="gin"),
+        # id tie-breaker lets (timestamp, id) ordered listings and keyset seeks walk the index
+        Index("idx_events_tenant_time", "tenant_id", timestamp.desc(), id.desc()),
+        # jsonb_path_ops: a fraction of default jsonb_ops size, serving every @> containment filter
+        Index(
+            "ix_events_payload_gin",
+            "payload",
+            postgresql_using="gin",
+            postgresql_ops={"payload": "jsonb_path_ops"},
+        ),
+        Index(
+            "ix_events_payload_search_trgm",
+            "payload_search",
+            postgresql_using="gin",
+            postgresql_ops={"payload_search": "gin_trgm_ops"},
+        ),
+        Index("ix_events_payload_tsv", "payload_tsv", postgresql_using="gin"),
+        # Small cache-hot partial B-trees for the hottest low-cardinality payload filters
+        Index(
+            "ix_events_status_failed",
+            "tenant_id",
+            timestamp.desc(),
+            postgresql_where=FAILED_STATUS_PREDICATE,
+        ),
+        Index(
+            "ix_events_cluster",
+            "tenant_id",
+            text("(payload ->> 'cluster_id')"),
+            postgresql_where=text("payload ? 'cluster_id'"),
+        ),
     )
 
 
+# Trigram operator classes live in pg_trgm; ensure it exists before the events table
+event.listen(
+    Event.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm"),
+)
+
+
 class ExecutionSummary(Base):
     """Production execution index natively mapping full graph structural summaries."""
 
@@ -35,8 +123,39 @@ class ExecutionSummary(Base):
     tenant_id = Column(String, nullable=False, index=True)
     created_at = Column(DateTime(timezone=True), nullable=False, index=True)
     node_count = Column(Integer, nullable=False, default=1)
+    # Distinct graph node names captured at ingest so function_name search runs in SQL
+    node_names = Column(
+        JSONB, nullable=False, default=list, server_default=text("'[]'::jsonb")
+    )
+
+    __table_args__ = (
+        # id tie-breaker lets (created_at, id) keyset seeks walk the index; node_count rides
+        # along so listing pages (id, tenant_id, created_at, node_count) scan index-only
+        Index(
+            "ix_execs_tenant_created",
+            "tenant_id",
+            "created_at",
+            "id",
+            postgresql_include=["node_count"],
+        ),
+        # Default jsonb_ops GIN: supports the ? key-existence operator on node_names
+        Index("ix_execsum_nodenames", "node_names", postgresql_using="gin"),
+        # Trigram GIN answering the leading-wildcard id ILIKE of execution search
+        Index(
+            "ix_execsummary_id_trgm",
+            "id",
+            postgresql_using="gin",
+            postgresql_ops={"id": "gin_trgm_ops"},
+        ),
+    )
 
-    __table_args__ = (Index("ix_execs_tenant_created", "tenant_id", "created_at"),)
+
+# Table create order is not guaranteed, so this table ensures pg_trgm exists as well
+event.listen(
+    ExecutionSummary.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm"),
+)
 
 
 class Incident(Base):
@@ -53,9 +172,21 @@ class Incident(Base):
     summary = Column(String, nullable=True)
 
     # Structural telemetry fingerprints natively bounding recurring anomaly alerts
-    fingerprint = Column(String, nullable=False, index=True, default="")
+    fingerprint = Column(String(32), nullable=False, index=True, default="")
     occurrence_count = Column(Integer, nullable=False, default=1)
 
+    __table_args__ = (
+        # Newest-first incident listings and their (timestamp, id) keyset seeks
+        Index("ix_incidents_tenant_time", "tenant_id", timestamp.desc(), id.desc()),
+        # Serves the per-batch DISTINCT ON (tenant_id, fingerprint) grouping lookup
+        Index(
+            "ix_incidents_tenant_fingerprint_time",
+            "tenant_id",
+            "fingerprint",
+            timestamp.desc(),
+        ),
+    )
+
 
 class AlertRule(Base):
     """Production alert mapping constraints uniquely tracking notification parameters natively."""
@@ -84,6 +84,10 @@ class SearchRequest(BaseModel):
     )
     limit: int = Field(50, ge=1, le=1000, description="Pagination slicing maximums")
     offset: int = Field(0, ge=0, description="Pagination displacement slice offset")
+    cursor: Optional[str] = Field(
+        None,
+        description="Previous page's next_cursor; seeks past it instead of applying offset",
+    )
 
 
 class DiffPayload(BaseModel):
@@ -1,17 +1,259 @@
-import asyncio
+import base64
+import functools
+import json
 import time
 import logging
-from typing import List, Dict, Any, Tuple
+import re
+import uuid
+from datetime import datetime
+from typing import List, Dict, Any, Optional, Tuple
 from sqlalchemy.future import select
-from sqlalchemy import or_, and_, asc, desc, cast, String
+from sqlalchemy import (
+    or_,
+    and_,
+    asc,
+    desc,
+    cast,
+    case,
+    column,
+    func,
+    literal,
+    text,
+    true,
+    String,
+    tuple_,
+)
 from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
 
-from app.core.database import async_session_maker
-from app.models.event import Event, Incident
+from app.core.database import async_read_session_maker
+from app.models.event import Event, Incident, FAILED_STATUS_PREDICATE
 from app.query.models import MultiResourceQueryRequest, QueryResult
 
 logger = logging.getLogger("temporallayr.query.engine")
 
+# Whitespace-separated plain words route to the tsvector index; anything else (single
+# tokens that may be substrings, punctuation, JSON fragments) stays on trigram LIKE
+_PHRASE_RE = re.compile(r"^\w+(\s+\w+)+$")
+
+# Rows fetched per server-side cursor round trip while streaming query results
+_STREAM_CHUNK = 500
+
+# SQLSTATE raised when statement_timeout cancels a running query
+_QUERY_CANCELED = "57014"
+
+
+def _is_statement_timeout(error: DBAPIError) -> bool:
+    """Detects server-side statement_timeout cancellations across DBAPI adapters."""
+    orig = getattr(error, "orig", None)
+    code = getattr(orig, "pgcode", None) or getattr(orig, "sqlstate", None)
+    return code == _QUERY_CANCELED
+
+
+def encode_cursor(timestamp: datetime, row_id: Any) -> str:
+    """Packs the trailing (timestamp, id) keyset boundary into an opaque URL-safe cursor."""
+    raw = f"{timestamp.isoformat()}|{row_id}"
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str, id_type=uuid.UUID) -> Optional[Tuple[datetime, Any]]:
+    """Unpacks a keyset cursor returning None natively when it is malformed.
+
+    ``id_type`` converts the id half; pass ``str`` for tables keyed by text ids.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+        # isoformat() never contains "|", so the first one ends the timestamp; text ids may
+        ts_iso, row_id = raw.split("|", 1)
+        return datetime.fromisoformat(ts_iso), id_type(row_id)
+    except Exception:
+        logger.warning(f"[QUERY] Ignoring malformed pagination cursor: {cursor!r}")
+        return None
+
+
+def _apply_keyset(stmt, ts_col, id_col, query: MultiResourceQueryRequest):
+    """Orders by (timestamp, id) and seeks past the cursor boundary instead of OFFSET scans."""
+    descending = query.sort.direction == "desc"
+    if descending:
+        stmt = stmt.order_by(ts_col.desc(), id_col.desc())
+    else:
+        stmt = stmt.order_by(ts_col.asc(), id_col.asc())
+
+    boundary = decode_cursor(query.cursor) if query.cursor else None
+    if boundary is None:
+        return stmt.offset(query.offset)
+
+    keyset = tuple_(ts_col, id_col)
+    return stmt.where(keyset < boundary if descending else keyset > boundary)
+
+
+def _next_cursor(rows: List[Any], limit: int) -> Optional[str]:
+    """Emits a cursor from the final row only when the page came back full."""
+    if not rows or len(rows) < limit:
+        return None
+    last = rows[-1]
+    return encode_cursor(last.timestamp, last.id)
+
+
+def _phrase_prefix_query(search_text: str) -> str:
+    """to_tsquery text matching the words in order, the final one by prefix.
+
+    Only called for _PHRASE_RE input, so every term is a plain word and needs no quoting.
+    """
+    words = search_text.split()
+    return " <-> ".join(words[:-1] + [f"{words[-1]}:*"])
+
+
+def _apply_event_filters(stmt, query: MultiResourceQueryRequest):
+    """Binds tenant, payload and temporal predicates shared by every events-backed search."""
+    stmt = stmt.where(Event.tenant_id == query.tenant_id)
+
+    # Apply strict query boundaries natively
+    filters = query.filters
+    if filters.execution_id:
+        stmt = stmt.where(
+            Event.payload.op("->>")("execution_id") == filters.execution_id
+        )
+    if filters.status == "FAILED":
+        # Literal predicate so the ix_events_status_failed partial index applies
+        stmt = stmt.where(FAILED_STATUS_PREDICATE)
+    elif filters.status:
+        # Containment so the jsonb_path_ops GIN index serves any other status
+        stmt = stmt.where(Event.payload.contains({"status": filters.status}))
+    if filters.time_range:
+        if filters.time_range.start:
+            stmt = stmt.where(Event.timestamp >= filters.time_range.start)
+        if filters.time_range.end:
+            stmt = stmt.where(Event.timestamp <= filters.time_range.end)
+
+    if query.search_text:
+        search_text = query.search_text.strip()
+        if _PHRASE_RE.match(search_text):
+            # Adjacent words: phrase match against the GIN tsvector column, the last word
+            # as a prefix so a partially typed trailing word ("connection ref") still hits
+            stmt = stmt.where(
+                Event.payload_tsv.op("@@")(
+                    func.to_tsquery("simple", _phrase_prefix_query(search_text))
+                )
+            )
+        else:
+            # Plain LIKE against the pre-lowercased generated column (trigram indexed)
+            text_filter = f"%{query.search_text.lower()}%"
+            stmt = stmt.where(Event.payload_search.like(text_filter))
+
+    # Node specific mapping (JSONB "@>") natively
+    if filters.node_name:
+        # Match executions dynamically containing a node named X
+        node_match = [{"name": filters.node_name}]
+        # We query if payload->'graph'->'nodes' contains this dict natively
+        stmt = stmt.where(Event.payload["graph"]["nodes"].contains(node_match))
+
+    return stmt
+
+
+# Statements are immutable, so identical requests (dashboard refreshes, repeated saved
+# queries) reuse the built Select keyed on the normalized request JSON. The key carries
+# every filter plus cursor/offset, so edited saved queries naturally miss the cache.
+@functools.lru_cache(maxsize=512)
+def _build_events_statement(query_key: str):
+    query = MultiResourceQueryRequest.model_validate_json(query_key)
+    # Project only what the response and the keyset cursor need; no ORM hydration
+    stmt = _apply_event_filters(select(Event.payload, Event.timestamp, Event.id), query)
+
+    # Apply keyset sort boundaries natively (timestamp is the only sortable field)
+    return _apply_keyset(stmt, Event.timestamp, Event.id, query)
+
+
+@functools.lru_cache(maxsize=512)
+def _build_incidents_statement(query_key: str):
+    query = MultiResourceQueryRequest.model_validate_json(query_key)
+    # Explicit projection: only the response columns cross the wire, skipping ORM identity mapping
+    stmt = select(
+        Incident.id,
+        Incident.execution_id,
+        Incident.timestamp,
+        Incident.failure_type,
+        Incident.node_name,
+        Incident.summary,
+        Incident.fingerprint,
+        Incident.occurrence_count,
+    ).where(Incident.tenant_id == query.tenant_id)
+
+    filters = query.filters
+    if filters.incident_id:
+        stmt = stmt.where(cast(Incident.id, String) == filters.incident_id)
+    if filters.execution_id:
+        stmt = stmt.where(Incident.execution_id == filters.execution_id)
+    if filters.node_name:
+        stmt = stmt.where(Incident.node_name == filters.node_name)
+    if filters.fingerprint:
+        stmt = stmt.where(Incident.fingerprint == filters.fingerprint)
+
+    if filters.time_range:
+        if filters.time_range.start:
+            stmt = stmt.where(Incident.timestamp >= filters.time_range.start)
+        if filters.time_range.end:
+            stmt = stmt.where(Incident.timestamp <= filters.time_range.end)
+
+    if query.search_text:
+        stmt = stmt.where(Incident.summary.ilike(f"%{query.search_text}%"))
+
+    return _apply_keyset(stmt, Incident.timestamp, Incident.id, query)
+
+
+@functools.lru_cache(maxsize=512)
+def _build_nodes_statement(query_key: str):
+    query = MultiResourceQueryRequest.model_validate_json(query_key)
+
+    # Guard non-array graphs so jsonb_array_elements never raises mid-scan
+    nodes = Event.payload["graph"]["nodes"]
+    safe_nodes = case(
+        (func.jsonb_typeof(nodes) == "array", nodes),
+        else_=cast(literal("[]", String), JSONB),
+    )
+    node = (
+        func.jsonb_array_elements(safe_nodes)
+        .table_valued(column("node", JSONB))
+        .lateral("n")
+    )
+
+    stmt = select(node.c.node).select_from(Event).join(node, true())
+    stmt = _apply_event_filters(stmt, query)
+    if query.filters.node_name:
+        stmt = stmt.where(node.c.node["name"].astext == query.filters.node_name)
+
+    if query.sort.direction == "desc":
+        stmt = stmt.order_by(Event.timestamp.desc(), Event.id.desc())
+    else:
+        stmt = stmt.order_by(Event.timestamp.asc(), Event.id.asc())
+    return stmt.offset(query.offset)
+
+
+class _ExplainJSON(Executable, ClauseElement):
+    """Wraps a Select as EXPLAIN (FORMAT JSON) keeping its bound parameters intact."""
+
+    inherit_cache = False
+
+    def __init__(self, statement):
+        self.statement = statement
+
+
+@compiles(_ExplainJSON, "postgresql")
+def _compile_explain_json(element, compiler, **kw):
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+async def approx_count(session, stmt) -> int:
+    """Reads the planner's row estimate for a statement instead of running COUNT(*)."""
+    unbounded = stmt.order_by(None).limit(None).offset(None)
+    result = await session.execute(_ExplainJSON(unbounded))
+    plan = result.scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
 
 class QueryEngine:
     """Enterprise Query Engine with strict timeout safeguards binding multitenant queries natively."""
@@ -21,26 +263,46 @@ class QueryEngine:
         self.max_limit = max_limit
 
     async def _execute_with_safeguards(
-        self, stmt, limit: int
+        self, stmt, limit: int, scalars: bool = True
     ) -> Tuple[List[Any], bool]:
-        """Runs structurally complex SQL natively trapping timeouts accurately preserving app stability."""
+        """Runs structurally complex SQL natively trapping timeouts accurately preserving app stability.
+
+        Rows are pulled through a server-side cursor in ``yield_per`` chunks into a list
+        capped at the effective limit; pass ``scalars=False`` to receive multi-column Rows.
+        """
         actual_limit = min(limit, self.max_limit)
         stmt = stmt.limit(actual_limit)
 
         start_time = time.time()
         is_partial = False
         results = []
+        timeout_ms = int(self.default_timeout * 1000)
 
         try:
-            async with async_session_maker() as session:
-                task = asyncio.create_task(session.execute(stmt))
-                result = await asyncio.wait_for(task, timeout=self.default_timeout)
-                results = list(result.scalars().all())
-
-        except asyncio.TimeoutError:
-            logger.warning(
-                "[QUERY] Execution timeout safely bounded returning empty flags organically."
-            )
+            async with async_read_session_maker() as session:
+                # Postgres enforces the budget itself, aborting the backend query instead of
+                # leaving it running after a client-side cancellation. SET LOCAL is scoped to
+                # this transaction so pooled connections return with their defaults.
+                await session.execute(
+                    text(f"SET LOCAL statement_timeout = '{timeout_ms}ms'")
+                )
+                stream = await session.stream(
+                    stmt.execution_options(yield_per=_STREAM_CHUNK)
+                )
+                if scalars:
+                    stream = stream.scalars()
+                async for item in stream:
+                    results.append(item)
+                    if len(results) >= actual_limit:
+                        break
+
+        except DBAPIError as e:
+            if _is_statement_timeout(e):
+                logger.warning(
+                    "[QUERY] Execution timeout safely bounded returning empty flags organically."
+                )
+            else:
+                logger.error(f"[QUERY] Execution failed natively safely: {e}")
             is_partial = True
         except Exception as e:
             logger.error(f"[QUERY] Execution failed natively safely: {e}")
@@ -52,46 +314,22 @@ class QueryEngine:
 
         return results, is_partial
 
+    async def _estimate_total(self, stmt, fallback: int) -> int:
+        """Planner-estimated total for full pages; never fails the surrounding query."""
+        try:
+            async with async_read_session_maker() as session:
+                return max(await approx_count(session, stmt), fallback)
+        except Exception as e:
+            logger.warning(f"[QUERY] Row estimate unavailable natively: {e}")
+            return fallback
+
     async def search_events(self, query: MultiResourceQueryRequest) -> QueryResult:
         """Search execution trace payloads directly checking boundaries natively."""
-        stmt = select(Event).where(Event.tenant_id == query.tenant_id)
-
-        # Apply strict query boundaries natively
-        filters = query.filters
-        if filters.execution_id:
-            stmt = stmt.where(
-                Event.payload.op("->>")("execution_id") == filters.execution_id
-            )
-        if filters.status:
-            stmt = stmt.where(Event.payload.op("->>")("status") == filters.status)
-        if filters.time_range:
-            if filters.time_range.start:
-                stmt = stmt.where(Event.timestamp >= filters.time_range.start)
-            if filters.time_range.end:
-                stmt = stmt.where(Event.timestamp <= filters.time_range.end)
-
-        if query.search_text:
-            text_filter = f"%{query.search_text}%"
-            # Full text ILIKE match across the JSON payload dynamically
-            stmt = stmt.where(cast(Event.payload, String).ilike(text_filter))
-
-        # Node specific mapping (JSONB "@>") natively
-        if filters.node_name:
-            # Match executions dynamically containing a node named X
-            node_match = [{"name": filters.node_name}]
-            # We query if payload->'graph'->'nodes' contains this dict natively
-            stmt = stmt.where(Event.payload["graph"]["nodes"].contains(node_match))
-
-        # Apply sort boundaries natively
-        if query.sort.field == "timestamp":
-            if query.sort.direction == "desc":
-                stmt = stmt.order_by(Event.timestamp.desc())
-            else:
-                stmt = stmt.order_by(Event.timestamp.asc())
-
-        stmt = stmt.offset(query.offset)
+        stmt = _build_events_statement(query.model_dump_json(exclude={"limit"}))
 
-        results, is_partial = await self._execute_with_safeguards(stmt, query.limit)
+        results, is_partial = await self._execute_with_safeguards(
+            stmt, query.limit, scalars=False
+        )
 
         logger.info(f"[QUERY] tenant={query.tenant_id} rows={len(results)}")
         warning = (
@@ -102,41 +340,29 @@ class QueryEngine:
 
         # Hydrate JSON explicitly avoiding Pydantic ORM strict serialization issues
         data = [r.payload for r in results]
+
+        # A short page is its own exact count; a full page means more rows exist, so
+        # report the planner estimate rather than paying for a second COUNT(*) scan
+        actual_limit = min(query.limit, self.max_limit)
+        total = len(data)
+        if total and total == actual_limit and not is_partial:
+            total = await self._estimate_total(stmt, total)
+
         return QueryResult(
-            data=data, total=len(data), partial=is_partial, warning=warning
+            data=data,
+            total=total,
+            partial=is_partial,
+            warning=warning,
+            next_cursor=_next_cursor(results, actual_limit),
         )
 
     async def search_incidents(self, query: MultiResourceQueryRequest) -> QueryResult:
         """Search alert traces explicitly mapped over anomalies natively."""
-        stmt = select(Incident).where(Incident.tenant_id == query.tenant_id)
-
-        filters = query.filters
-        if filters.incident_id:
-            stmt = stmt.where(cast(Incident.id, String) == filters.incident_id)
-        if filters.execution_id:
-            stmt = stmt.where(Incident.execution_id == filters.execution_id)
-        if filters.node_name:
-            stmt = stmt.where(Incident.node_name == filters.node_name)
-        if filters.fingerprint:
-            stmt = stmt.where(Incident.fingerprint == filters.fingerprint)
-
-        if filters.time_range:
-            if filters.time_range.start:
-                stmt = stmt.where(Incident.timestamp >= filters.time_range.start)
-            if filters.time_range.end:
-                stmt = stmt.where(Incident.timestamp <= filters.time_range.end)
-
-        if query.search_text:
-            stmt = stmt.where(Incident.summary.ilike(f"%{query.search_text}%"))
-
-        if query.sort.direction == "desc":
-            stmt = stmt.order_by(Incident.timestamp.desc())
-        else:
-            stmt = stmt.order_by(Incident.timestamp.asc())
-
-        stmt = stmt.offset(query.offset)
+        stmt = _build_incidents_statement(query.model_dump_json(exclude={"limit"}))
 
-        results, is_partial = await self._execute_with_safeguards(stmt, query.limit)
+        results, is_partial = await self._execute_with_safeguards(
+            stmt, query.limit, scalars=False
+        )
         logger.info(f"[QUERY] tenant={query.tenant_id} rows={len(results)}")
 
         data = [
@@ -155,53 +381,52 @@ class QueryEngine:
 
         warning = "Partial results returned natively." if is_partial else None
         return QueryResult(
-            data=data, total=len(data), partial=is_partial, warning=warning
+            data=data,
+            total=len(data),
+            partial=is_partial,
+            warning=warning,
+            next_cursor=_next_cursor(results, min(query.limit, self.max_limit)),
         )
 
     async def search_nodes(self, query: MultiResourceQueryRequest) -> QueryResult:
-        """Isolated wrapper delegating to search_events but specifically requesting node extracts.
-        For architectural purity, we filter events by node and extract matching nodes physically.
+        """Unnests graph nodes natively in Postgres via a LATERAL jsonb_array_elements join,
+        returning only matching node objects instead of walking every event payload in Python.
         """
-        # We parse the base executions and extract nodes explicitly bounding in memory to simulate
-        # complex PostgreSQL lateral joins without destabilizing bounds organically.
-        event_res = await self.search_events(query)
-
-        extracted_nodes = []
-        for ev in event_res.data:
-            nodes = ev.get("graph", {}).get("nodes", [])
-            for n in nodes:
-                # Apply text search explicitly if it wasn't caught safely
-                if query.filters.node_name and n.get("name") != query.filters.node_name:
-                    continue
-                extracted_nodes.append(n)
-                if len(extracted_nodes) >= min(query.limit, self.max_limit):
-                    break
-            if len(extracted_nodes) >= min(query.limit, self.max_limit):
-                break
-
-        logger.info(f"[QUERY] tenant={query.tenant_id} rows={len(extracted_nodes)}")
+        stmt = _build_nodes_statement(query.model_dump_json(exclude={"limit"}))
+        results, is_partial = await self._execute_with_safeguards(stmt, query.limit)
+
+        logger.info(f"[QUERY] tenant={query.tenant_id} rows={len(results)}")
+        warning = (
+            "Partial results returned due to heavy query limits."
+            if is_partial
+            else None
+        )
         return QueryResult(
-            data=extracted_nodes,
-            total=len(extracted_nodes),
-            partial=event_res.partial,
-            warning=event_res.warning,
+            data=results,
+            total=len(results),
+            partial=is_partial,
+            warning=warning,
         )
 
     async def search_clusters(self, query: MultiResourceQueryRequest) -> QueryResult:
         """Search execution metadata flags natively finding cluster aggregates."""
         # Clusters are derived natively over "attributes.cluster_id" mapped into the payload.
-        stmt = select(Event).where(Event.tenant_id == query.tenant_id)
+        stmt = select(Event.payload).where(Event.tenant_id == query.tenant_id)
 
         if query.filters.cluster_id:
+            # Inline the key and repeat the "?" guard so ix_events_cluster (partial) matches
+            cluster_key = text("'cluster_id'")
             stmt = stmt.where(
-                Event.payload.op("->>")("cluster_id") == query.filters.cluster_id
+                Event.payload.op("?")(cluster_key),
+                Event.payload.op("->>")(cluster_key) == query.filters.cluster_id,
             )
 
-        if query.time_range:
-            if query.time_range.start:
-                stmt = stmt.where(Event.timestamp >= query.time_range.start)
-            if query.time_range.end:
-                stmt = stmt.where(Event.timestamp <= query.time_range.end)
+        time_range = query.filters.time_range
+        if time_range:
+            if time_range.start:
+                stmt = stmt.where(Event.timestamp >= time_range.start)
+            if time_range.end:
+                stmt = stmt.where(Event.timestamp <= time_range.end)
 
         stmt = stmt.offset(query.offset)
         results, is_partial = await self._execute_with_safeguards(stmt, query.limit)
@@ -209,10 +434,9 @@ class QueryEngine:
         logger.info(f"[QUERY] tenant={query.tenant_id} rows={len(results)}")
         warning = "Partial results returned natively." if is_partial else None
 
-        # Return exact cluster trace bounds organically
-        data = [r.payload for r in results]
+        # Return exact cluster trace bounds organically (payloads arrive as scalars)
         return QueryResult(
-            data=data, total=len(data), partial=is_partial, warning=warning
+            data=results, total=len(results), partial=is_partial, warning=warning
         )
 
 
@@ -30,6 +30,8 @@ class MultiResourceQueryRequest(BaseModel):
     sort: SortOption = Field(default_factory=SortOption)
     limit: int = Field(default=100, le=5000)
     offset: int = Field(default=0, ge=0)
+    # Opaque keyset cursor (base64 "ts_iso|id") superseding offset when present
+    cursor: Optional[str] = None
 
 
 class QueryResult(BaseModel):
@@ -37,6 +39,7 @@ class QueryResult(BaseModel):
     total: int
     partial: bool = False
     warning: Optional[str] = None
+    next_cursor: Optional[str] = None
 
 
 class QueryRequest(BaseModel):
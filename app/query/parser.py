@@ -1,6 +1,7 @@
 from enum import Enum
-from typing import List, Union
-from pydantic import BaseModel, Field
+from functools import lru_cache
+from typing import Tuple, Union
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class Operator(str, Enum):
@@ -11,20 +12,27 @@ class Operator(str, Enum):
 
 
 class Condition(BaseModel):
+    # Frozen so memoized ASTs can be shared safely between callers
+    model_config = ConfigDict(frozen=True)
+
     field: str
     operator: Operator
     value: Union[str, int, float]
 
 
 class QueryAST(BaseModel):
-    conditions: List[Condition]
+    model_config = ConfigDict(frozen=True)
+
+    conditions: Tuple[Condition, ...]
 
 
+@lru_cache(maxsize=1024)
 def parse_query(query: str) -> QueryAST:
     """
     Parses a simple query string into a QueryAST.
     Supports: field operator value [AND field operator value ...]
     Operators: ==, !=, >, <
+    Results are memoized per query string; the returned AST is immutable.
     """
     if not query or not query.strip():
         return QueryAST(conditions=[])
@@ -1,6 +1,8 @@
 import asyncio
+import functools
+import json
 import logging
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 
 from app.query.engine import query_engine
 from app.dashboard.service import dashboard_service
@@ -8,22 +10,43 @@ from app.query.models import MultiResourceQueryRequest
 
 logger = logging.getLogger("temporallayr.query.runtime")
 
+# Caps concurrently executing panels across all dashboards so fan-out never starves the DB pool
+_PANEL_CONCURRENCY = asyncio.Semaphore(10)
 
-async def execute_saved_query(saved_query_id: str, tenant_id: str) -> Dict[str, Any]:
-    """Dynamically converts a bound JSON Query structural layout into an execution stream cleanly over the backend."""
-    # Note: dashboard_service list_saved_queries validates tenant mapping natively,
-    # but we will just manually fetch the single query via DB. Oh wait, dashboard_service
-    # doesn't have a `get_saved_query` natively right now. Let's add that or fetch it functionally.
-    queries = await dashboard_service.list_saved_queries(tenant_id=tenant_id)
-    target_query = next((q for q in queries if str(q.id) == saved_query_id), None)
+# Per-panel budget, covering both the wait for a concurrency slot and the query itself
+PANEL_TIMEOUT_SECONDS = 10.0
 
-    if not target_query:
-        raise ValueError(
-            f"SavedQuery {saved_query_id} not found or tenant isolation blocked access."
-        )
+
+@functools.lru_cache(maxsize=512)
+def _parse_saved_request(normalized_query: str) -> MultiResourceQueryRequest:
+    """Memoizes Pydantic validation of saved query JSON keyed by its canonical serialization."""
+    return MultiResourceQueryRequest(**json.loads(normalized_query))
+
+
+async def execute_saved_query(
+    saved_query_id: str, tenant_id: str, query_json: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """Dynamically converts a bound JSON Query structural layout into an execution stream cleanly over the backend.
+
+    Callers that already loaded the tenant-scoped saved query (dashboard panels) pass
+    its ``query_json`` directly, skipping the per-call saved query lookup.
+    """
+    if query_json is None:
+        # Note: dashboard_service list_saved_queries validates tenant mapping natively,
+        # but we will just manually fetch the single query via DB. Oh wait, dashboard_service
+        # doesn't have a `get_saved_query` natively right now. Let's add that or fetch it functionally.
+        queries = await dashboard_service.list_saved_queries(tenant_id=tenant_id)
+        target_query = next((q for q in queries if str(q.id) == saved_query_id), None)
+
+        if not target_query:
+            raise ValueError(
+                f"SavedQuery {saved_query_id} not found or tenant isolation blocked access."
+            )
+        query_json = target_query.query_json
 
     # Cast raw JSONB structural properties back onto Pydantic Models dynamically shielding bounds.
-    raw_query = target_query.query_json
+    # Shallow copy so the tenant override never leaks back into the stored query_json
+    raw_query = dict(query_json)
 
     # We enforce tenant_id strictly replacing whatever is originally there validating isolation statically
     raw_query["tenant_id"] = tenant_id
@@ -56,7 +79,10 @@ async def execute_saved_query(saved_query_id: str, tenant_id: str) -> Dict[str,
     if "limit" not in raw_query:
         raw_query["limit"] = 100
 
-    mr_req = MultiResourceQueryRequest(**raw_query)
+    # Canonical JSON key: edits to the saved query change the key and bypass stale entries.
+    # Copy the cached model so downstream mutation can never poison other panels.
+    normalized = json.dumps(raw_query, sort_keys=True, default=str)
+    mr_req = _parse_saved_request(normalized).model_copy(deep=True)
 
     # Dispatch structural mapping block securely via QueryEngine
     query_result = await query_engine.query(mr_req)
@@ -70,11 +96,18 @@ async def _run_panel_safe(panel, tenant_id: str) -> Dict[str, Any]:
     query_id_str = str(panel["saved_query"]["id"])
     logger.info(f"[PANEL QUERY START] panel={panel_id_str} query={query_id_str}")
 
+    async def _throttled_query():
+        # Acquired inside the timed coroutine: the semaphore is process-wide, so queueing
+        # behind other dashboards' panels must count against this panel's budget
+        async with _PANEL_CONCURRENCY:
+            return await execute_saved_query(
+                saved_query_id=query_id_str,
+                tenant_id=tenant_id,
+                query_json=panel["saved_query"].get("query_json"),
+            )
+
     try:
-        data = await asyncio.wait_for(
-            execute_saved_query(saved_query_id=query_id_str, tenant_id=tenant_id),
-            timeout=10.0,
-        )
+        data = await asyncio.wait_for(_throttled_query(), timeout=PANEL_TIMEOUT_SECONDS)
         logger.info(f"[PANEL QUERY DONE] panel={panel_id_str} results={len(data)}")
         return {"panel_id": panel_id_str, "name": panel["name"], "data": data}
     except asyncio.TimeoutError:
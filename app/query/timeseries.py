@@ -1,32 +1,108 @@
 import logging
-import math
 from typing import Dict, Any, List, Optional
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
+from sqlalchemy import Float, func, literal
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.future import select
 
-from app.core.database import async_session_maker
+from app.core.database import async_read_session_maker
 from app.models.event import Event
 
 logger = logging.getLogger("temporallayr.query.timeseries")
 
+# Fixed epoch origin anchoring date_bin grids identically to the previous floor(ts / interval) bucketing
+_BUCKET_ORIGIN = datetime(1970, 1, 1, tzinfo=timezone.utc)
 
-def _compute_percentile(data: List[float], percentile: float) -> float:
-    """Computes mathematically correct percentile over bounds safely."""
-    if not data:
-        return 0.0
+# t-digest centroid budget: bounded per-bucket memory regardless of sample count
+_TDIGEST_COMPRESSION = 100
 
-    data.sort()
-    k = (len(data) - 1) * (percentile / 100.0)
-    f = math.floor(k)
-    c = math.ceil(k)
+# SQLSTATE undefined_function, raised when the tdigest extension is not installed
+_UNDEFINED_FUNCTION = "42883"
 
-    if f == c:
-        return data[int(k)]
+# Flipped off the first time the database reports tdigest missing, so subsequent
+# requests go straight to percentile_cont instead of failing once per call
+_tdigest_available = True
 
-    d0 = data[int(f)]
-    d1 = data[int(c)]
-    return d0 + (d1 - d0) * (k - f)
+
+def _p95_expression(duration, use_tdigest: bool):
+    if use_tdigest:
+        return func.tdigest_percentile(duration, _TDIGEST_COMPRESSION, 0.95)
+    # Exact fallback: sorts each bucket's samples inside Postgres
+    return func.percentile_cont(0.95).within_group(duration)
+
+
+def _is_undefined_function(error: DBAPIError) -> bool:
+    orig = getattr(error, "orig", None)
+    code = getattr(orig, "pgcode", None) or getattr(orig, "sqlstate", None)
+    return code == _UNDEFINED_FUNCTION
+
+
+def _bucket_count(row) -> int:
+    return row.count
+
+
+def _bucket_error_rate(row) -> float:
+    return round((row.errors / row.count * 100.0) if row.count > 0 else 0.0, 2)
+
+
+def _bucket_latency_avg(row) -> float:
+    return round(float(row.avg_duration or 0.0), 2)
+
+
+def _bucket_latency_p95(row) -> float:
+    return round(float(row.p95 or 0.0), 2)
+
+
+# Metric name -> projection over an aggregated bucket row
+_METRIC_VALUES = {
+    "execution_count": _bucket_count,
+    "error_rate": _bucket_error_rate,
+    "latency_avg": _bucket_latency_avg,
+    "latency_p95": _bucket_latency_p95,
+}
+
+
+def _build_aggregate_query(
+    tenant_id: str,
+    start_time: datetime,
+    end_time: datetime,
+    interval_seconds: int,
+    metric: str,
+    filters: Optional[Dict[str, Any]],
+    use_tdigest: bool,
+):
+    bucket = func.date_bin(
+        literal(timedelta(seconds=interval_seconds)),
+        Event.timestamp,
+        literal(_BUCKET_ORIGIN),
+    ).label("bucket")
+    duration = func.coalesce(
+        Event.payload[("metrics", "duration_ms")].astext.cast(Float), 0.0
+    )
+
+    columns = [
+        bucket,
+        func.count().label("count"),
+        func.count().filter(Event.payload["status"].astext == "FAILED").label("errors"),
+        func.avg(duration).label("avg_duration"),
+    ]
+    # Quantiles are the costliest aggregate, so only pay for them when requested
+    if metric == "latency_p95":
+        columns.append(_p95_expression(duration, use_tdigest).label("p95"))
+
+    query = select(*columns).where(
+        Event.tenant_id == tenant_id,
+        Event.timestamp >= start_time,
+        Event.timestamp <= end_time,
+    )
+
+    # Optional filtering mapping bounds safely matching normal query engine logic organically
+    if filters:
+        for key, val in filters.items():
+            query = query.where(Event.payload[key].astext == str(val))
+
+    return query.group_by(bucket).order_by(bucket)
 
 
 async def aggregate_timeseries(
@@ -38,100 +114,63 @@ async def aggregate_timeseries(
     filters: Optional[Dict[str, Any]] = None,
 ) -> List[Dict[str, Any]]:
     """
-    Consumes highly-optimized execution streams grouping structural blocks naturally matching requested UI dimensions natively.
+    Pushes bucketing and aggregation natively into Postgres (date_bin + GROUP BY) returning one row per populated bucket.
     """
     logger.info(
         f"[TIMESERIES QUERY START] tenant={tenant_id} metric={metric} start={start_time} end={end_time}"
     )
 
-    # 1. Bootstrapping SQL limits dynamically resolving across streaming cursors effortlessly safely avoiding N+1 blocks
-    query = (
-        select(Event)
-        .where(
-            Event.tenant_id == tenant_id,
-            Event.timestamp >= start_time,
-            Event.timestamp <= end_time,
-        )
-        .order_by(Event.timestamp.asc())
+    # 1. Aggregate entirely server-side; only one row per bucket crosses the wire
+    global _tdigest_available
+    use_tdigest = metric == "latency_p95" and _tdigest_available
+    query = _build_aggregate_query(
+        tenant_id, start_time, end_time, interval_seconds, metric, filters, use_tdigest
     )
 
-    # Optional filtering mapping bounds safely matching normal query engine logic organically
-    if filters:
-        for key, val in filters.items():
-            query = query.where(Event.payload[key].astext == str(val))
-
-    buckets: Dict[int, Dict[str, Any]] = {}
-    total_events_processed = 0
-
-    async with async_session_maker() as session:
-        # Utilize yield_per dynamically resolving execution bounds into strictly memory-safe buffers (chunked by 5000 records organically)
-        execution_stream = await session.stream(query.execution_options(yield_per=5000))
-
-        async for row in execution_stream:
-            event: Event = row[0]
-            total_events_processed += 1
-
-            # Map absolute timestamps into bounded epoch discrete grids natively
-            if not event.timestamp.tzinfo:
-                ts = event.timestamp.replace(tzinfo=timezone.utc).timestamp()
-            else:
-                ts = event.timestamp.timestamp()
-
-            bucket_idx = int(ts // interval_seconds) * interval_seconds
-
-            if bucket_idx not in buckets:
-                buckets[bucket_idx] = {
-                    "timestamp": datetime.fromtimestamp(
-                        bucket_idx, tz=timezone.utc
-                    ).isoformat(),
-                    "count": 0,
-                    "errors": 0,
-                    "latencies": [],
-                    "avg_duration": 0.0,
-                    "error_rate": 0.0,
-                }
-
-            b = buckets[bucket_idx]
-            b["count"] += 1
-            status = event.payload.get("status", "UNKNOWN")
-            if status == "FAILED":
-                b["errors"] += 1
-
-            metrics_payload = event.payload.get("metrics", {})
-            duration_ms = metrics_payload.get("duration_ms", 0.0)
-            b["latencies"].append(float(duration_ms))
-
-    # 2. Materializing calculations neatly over streaming bins inherently correctly!
+    async with async_read_session_maker() as session:
+        try:
+            result = await session.execute(query)
+        except DBAPIError as e:
+            if not (use_tdigest and _is_undefined_function(e)):
+                raise
+            logger.warning(
+                "[TIMESERIES] tdigest extension unavailable, falling back to percentile_cont."
+            )
+            _tdigest_available = False
+            await session.rollback()
+            query = _build_aggregate_query(
+                tenant_id,
+                start_time,
+                end_time,
+                interval_seconds,
+                metric,
+                filters,
+                False,
+            )
+            result = await session.execute(query)
+        rows = result.all()
+
+    # 2. Shape aggregated rows into the UI series contract
     final_series = []
+    total_events_processed = 0
 
-    for _, b in sorted(buckets.items()):
-        cnt = b["count"]
-
-        # Calculate derived metrics structurally mapped
-        b["error_rate"] = (b["errors"] / cnt * 100.0) if cnt > 0 else 0.0
-        b["avg_duration"] = (sum(b["latencies"]) / cnt) if cnt > 0 else 0.0
-
-        # We process requested metrics natively dynamically ensuring UI charting aligns structurally gracefully!
-        res_data = {
-            "timestamp": b["timestamp"],
-            "count": cnt,
-            "errors": b["errors"],
-            "avg_duration": round(b["avg_duration"], 2),
-        }
-
-        if metric == "execution_count":
-            res_data["value"] = cnt
-        elif metric == "error_rate":
-            res_data["value"] = round(b["error_rate"], 2)
-        elif metric == "latency_avg":
-            res_data["value"] = round(b["avg_duration"], 2)
-        elif metric == "latency_p95":
-            res_data["value"] = round(_compute_percentile(b["latencies"], 95.0), 2)
-        else:
-            # Default bounds cleanly resolving unknown variables explicitly securely.
-            res_data["value"] = cnt
-
-        final_series.append(res_data)
+    # Resolve the metric projection once per request rather than per bucket.
+    # Unknown metrics default to the raw bucket count.
+    metric_value = _METRIC_VALUES.get(metric, _bucket_count)
+
+    for row in rows:
+        cnt = row.count
+        total_events_processed += cnt
+
+        final_series.append(
+            {
+                "timestamp": row.bucket.isoformat(),
+                "count": cnt,
+                "errors": row.errors,
+                "avg_duration": round(float(row.avg_duration or 0.0), 2),
+                "value": metric_value(row),
+            }
+        )
 
     logger.info(
         f"[TIMESERIES BUCKET COUNT] buckets={len(final_series)} events={total_events_processed}"
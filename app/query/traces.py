@@ -3,17 +3,18 @@ from typing import Dict, Any, List, Optional
 from uuid import UUID
 
 from sqlalchemy.future import select
-from sqlalchemy import desc
+from sqlalchemy import desc, func
+from sqlalchemy.dialects.postgresql import JSONB
 
 from app.core.database import async_session_maker
-from app.models.event import Event
+from app.models.event import Event, FAILED_STATUS_PREDICATE
 
 logger = logging.getLogger("temporallayr.query.traces")
 
 
 async def get_trace(tenant_id: str, trace_id: str) -> Dict[str, Any]:
     """Retrieves a fully bounded execution generic graph organically fetching explicitly."""
-    logger.info(f"[TRACE FETCH] tenant={tenant_id} trace_id={trace_id}")
+    logger.info("[TRACE FETCH] tenant=%s trace_id=%s", tenant_id, trace_id)
 
     try:
         query_id = UUID(trace_id)
@@ -21,20 +22,23 @@ async def get_trace(tenant_id: str, trace_id: str) -> Dict[str, Any]:
         return None
 
     async with async_session_maker() as session:
-        query = select(Event).where(Event.id == query_id, Event.tenant_id == tenant_id)
+        # Postgres renders the response object itself; no ORM entity is materialised
+        query = select(
+            func.jsonb_build_object(
+                "id",
+                Event.id,
+                "timestamp",
+                Event.timestamp,
+                "tenant_id",
+                Event.tenant_id,
+                "payload",
+                Event.payload,
+                type_=JSONB,  # decoded by the driver's JSONB codec, not returned as text
+            )
+        ).where(Event.id == query_id, Event.tenant_id == tenant_id)
 
         result = await session.execute(query)
-        event = result.scalars().first()
-
-        if not event:
-            return None
-
-        return {
-            "id": str(event.id),
-            "timestamp": event.timestamp.isoformat() if event.timestamp else None,
-            "tenant_id": event.tenant_id,
-            "payload": event.payload,
-        }
+        return result.scalars().first()
 
 
 async def list_traces(
@@ -42,7 +46,11 @@ async def list_traces(
 ) -> List[Dict[str, Any]]:
     """Lists bounded executions sequentially natively masking trace bounds across limits correctly."""
     logger.info(
-        f"[TRACE LIST] tenant={tenant_id} limit={limit} offset={offset} status={status}"
+        "[TRACE LIST] tenant=%s limit=%s offset=%s status=%s",
+        tenant_id,
+        limit,
+        offset,
+        status,
     )
 
     # Cap maximum limits structurally
@@ -50,32 +58,38 @@ async def list_traces(
     offset = max(0, offset)
 
     async with async_session_maker() as session:
-        query = select(Event).where(Event.tenant_id == tenant_id)
-
-        if status:
-            query = query.where(Event.payload["status"].astext == status)
+        # Project only the listing columns; the JSONB payload never leaves Postgres
+        query = select(
+            Event.id,
+            Event.timestamp,
+            func.coalesce(Event.payload["status"].astext, "UNKNOWN").label("status"),
+        ).where(Event.tenant_id == tenant_id)
+
+        if status == "FAILED":
+            # Literal predicate so the ix_events_status_failed partial index applies
+            query = query.where(FAILED_STATUS_PREDICATE)
+        elif status:
+            # Containment so the jsonb_path_ops GIN index serves any other status
+            query = query.where(Event.payload.contains({"status": status}))
 
         # Natively sorting descending tracking most recent executions automatically
-        query = query.order_by(desc(Event.timestamp)).limit(limit).offset(offset)
+        # (id tie-breaker keeps page boundaries stable and matches idx_events_tenant_time)
+        query = (
+            query.order_by(desc(Event.timestamp), desc(Event.id))
+            .limit(limit)
+            .offset(offset)
+        )
 
         result = await session.execute(query)
-        events = result.scalars().all()
+        rows = result.all()
 
         # Build optimized trace references masking payloads inherently mapping cleanly
-        items = []
-        for event in events:
-            evt_status = event.payload.get("status", "UNKNOWN")
-            is_error = evt_status == "FAILED"
-
-            items.append(
-                {
-                    "id": str(event.id),
-                    "timestamp": event.timestamp.isoformat()
-                    if event.timestamp
-                    else None,
-                    "error": is_error,
-                    "status": evt_status,
-                }
-            )
-
-        return items
+        return [
+            {
+                "id": str(row.id),
+                "timestamp": row.timestamp.isoformat() if row.timestamp else None,
+                "error": row.status == "FAILED",
+                "status": row.status,
+            }
+            for row in rows
+        ]
@@ -1,5 +1,5 @@
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 
 from app.rules.models import RuleSchema
 from app.rules.store import rule_store
@@ -21,89 +21,99 @@ class RuleEngine:
         if not tenant_id:
             return None
 
+        # Most tenants define no rules: answer from the snapshot's tenant set without a coroutine hop
+        known_tenants = rule_store.tenants_with_rules
+        if known_tenants is not None and tenant_id not in known_tenants:
+            return None
+
         try:
             rules = await rule_store.get_rules_for_tenant(tenant_id)
             if not rules:
                 return None
 
-            sorted_rules = sorted(rules, key=lambda r: r.priority, reverse=True)
+            # The store hands back enabled rules only, already in priority-desc order
             evaluated_count = 0
 
-            for rule in sorted_rules:
-                if not rule.enabled:
-                    continue
-
+            for rule in rules:
                 evaluated_count += 1
-                is_triggered = await self._evaluate_condition(rule, event)
+                try:
+                    is_triggered = rule.predicate(event)
+                except Exception as e:
+                    logger.error(
+                        "Evaluating structurally failed safe internally: %s", e
+                    )
+                    is_triggered = False
 
                 if is_triggered:
-                    logger.info(f"[RULE] triggered rule={rule.id} name='{rule.name}'")
-                    logger.info(f"[RULE] evaluated {evaluated_count} rules")
+                    logger.info(
+                        "[RULE] triggered rule=%s name='%s'", rule.id, rule.name
+                    )
+                    logger.info("[RULE] evaluated %d rules", evaluated_count)
                     return TriggerResult(rule=rule, event=event)
 
             # If no triggers match
-            logger.info(f"[RULE] evaluated {evaluated_count} rules")
+            logger.info("[RULE] evaluated %d rules", evaluated_count)
             return None
 
         except Exception as e:
-            logger.error(f"[RULE] evaluation failed safe: {e}")
+            logger.error("[RULE] evaluation failed safe: %s", e)
             return None
 
-    async def _evaluate_condition(
-        self, rule: RuleSchema, event: Dict[str, Any]
-    ) -> bool:
-        """Core parsing structurally checking telemetry bounds safely."""
-        cond_type = rule.condition.type
-        params = rule.condition.parameters
-
-        try:
-            if cond_type == "execution_latency":
-                duration = event.get("duration", 0)
-                threshold = params.get("threshold", 0)
-                return duration > threshold
-
-            elif cond_type == "divergence_detected":
-                metadata = event.get("metadata", {})
-                if isinstance(metadata, dict):
-                    return metadata.get("diverged") is True
-                return False
-
-            elif cond_type == "node_error_rate":
-                # In a fully stateless single-event pass, if 'error' metadata exists, we trigger it instantly
-                # simulating a rate spike for this node natively if count is 1
-                threshold = params.get("threshold", 1)
-                if threshold <= 1:
-                    metadata = event.get("metadata", {})
-                    meta_str = str(metadata).lower()
-                    if "error" in meta_str or "exception" in meta_str:
-                        return True
-                return False
-
-            elif cond_type == "cluster_anomaly":
-                # Match size spike or specific isolation flags mapping
-                cluster_size = event.get("cluster_size", 0)
-                threshold = params.get("threshold", 100)
-                return cluster_size > threshold
-
-            elif cond_type == "custom_expression":
-                # Safely evaluate primitive numeric constraints purely on event scalars natively
-                # e.g parameters{"field": "duration", "operator": ">", "value": 500} mapped loosely
-                # Or just generic simple match
-                field_name = params.get("field", "")
-                if field_name and field_name in event:
+    async def evaluate_events(
+        self, events: List[Dict[str, Any]]
+    ) -> List[Optional[TriggerResult]]:
+        """Evaluates a whole batch, returning the first matching rule per event (or None).
+
+        Loops are inverted relative to evaluate_event: each tenant's rule snapshot is fetched
+        once, then every rule (priority-desc) runs over the events it has not yet matched.
+        The first rule to match an event is still its highest-priority trigger.
+        """
+        results: List[Optional[TriggerResult]] = [None] * len(events)
+        known_tenants = rule_store.tenants_with_rules
+
+        by_tenant: Dict[str, List[int]] = {}
+        for index, event in enumerate(events):
+            tenant_id = event.get("tenant_id")
+            if not tenant_id:
+                continue
+            if known_tenants is not None and tenant_id not in known_tenants:
+                continue
+            by_tenant.setdefault(tenant_id, []).append(index)
+
+        for tenant_id, pending in by_tenant.items():
+            try:
+                rules = await rule_store.get_rules_for_tenant(tenant_id)
+            except Exception as e:
+                logger.error("[RULE] evaluation failed safe: %s", e)
+                continue
+
+            for rule in rules:
+                if not pending:
+                    break
+                predicate = rule.predicate
+                unmatched = []
+                for index in pending:
                     try:
-                        val = float(event[field_name])
-                        target = float(params.get("value", 0))
-                        return val > target
-                    except (ValueError, TypeError):
-                        pass
-                return False
-
-            return False
-
-        except Exception as e:
-            logger.error(f"Evaluating structurally failed safe internally: {e}")
-            return False
+                        is_triggered = predicate(events[index])
+                    except Exception as e:
+                        logger.error(
+                            "Evaluating structurally failed safe internally: %s", e
+                        )
+                        is_triggered = False
+                    if is_triggered:
+                        results[index] = TriggerResult(rule=rule, event=events[index])
+                    else:
+                        unmatched.append(index)
+                pending = unmatched
+
+            logger.info(
+                "[RULE] evaluated %d rules over %d events tenant=%s",
+                len(rules),
+                len(by_tenant[tenant_id]),
+                tenant_id,
+            )
+
+        return results
 
 
 rule_engine = RuleEngine()
@@ -1,12 +1,13 @@
 import uuid
-from typing import Dict, Any, Literal
+from typing import Dict, Any, Literal, Optional
 from datetime import datetime, UTC
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 from sqlalchemy import Column, String, Boolean, DateTime, Index, Integer
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 
 from app.core.database import Base
+from app.rules.predicates import compile_condition
 
 
 class Rule(Base):
@@ -62,6 +63,17 @@ class RuleSchema(BaseModel):
     actions: RuleActions
     created_at: datetime
 
+    _predicate: Optional[Any] = PrivateAttr(default=None)
+
+    @property
+    def predicate(self):
+        """Condition compiled into a specialized closure on first use, then reused per event."""
+        if self._predicate is None:
+            self._predicate = compile_condition(
+                self.condition.type, self.condition.parameters
+            )
+        return self._predicate
+
 
 class RuleCreateRequest(BaseModel):
     name: str
@@ -0,0 +1,91 @@
+import logging
+from typing import Any, Callable, Dict
+
+from app.services.failure_detector import looks_like_error
+
+logger = logging.getLogger("temporallayr.rules.predicates")
+
+Predicate = Callable[[Dict[str, Any]], bool]
+
+
+def _never(event: Dict[str, Any]) -> bool:
+    return False
+
+
+def _compile_execution_latency(params: Dict[str, Any]) -> Predicate:
+    threshold = params.get("threshold", 0)
+
+    def predicate(event: Dict[str, Any]) -> bool:
+        return event.get("duration", 0) > threshold
+
+    return predicate
+
+
+def _compile_divergence_detected(params: Dict[str, Any]) -> Predicate:
+    def predicate(event: Dict[str, Any]) -> bool:
+        metadata = event.get("metadata", {})
+        return isinstance(metadata, dict) and metadata.get("diverged") is True
+
+    return predicate
+
+
+def _compile_node_error_rate(params: Dict[str, Any]) -> Predicate:
+    # In a fully stateless single-event pass, if 'error' metadata exists, we trigger it instantly
+    # simulating a rate spike for this node natively if count is 1
+    if params.get("threshold", 1) > 1:
+        return _never
+
+    def predicate(event: Dict[str, Any]) -> bool:
+        return looks_like_error(event.get("metadata", {}))
+
+    return predicate
+
+
+def _compile_cluster_anomaly(params: Dict[str, Any]) -> Predicate:
+    # Match size spike or specific isolation flags mapping
+    threshold = params.get("threshold", 100)
+
+    def predicate(event: Dict[str, Any]) -> bool:
+        return event.get("cluster_size", 0) > threshold
+
+    return predicate
+
+
+def _compile_custom_expression(params: Dict[str, Any]) -> Predicate:
+    # Safely evaluate primitive numeric constraints purely on event scalars natively
+    # e.g parameters{"field": "duration", "operator": ">", "value": 500} mapped loosely
+    field_name = params.get("field", "")
+    if not field_name:
+        return _never
+    try:
+        target = float(params.get("value", 0))
+    except (ValueError, TypeError):
+        return _never
+
+    def predicate(event: Dict[str, Any]) -> bool:
+        if field_name not in event:
+            return False
+        try:
+            return float(event[field_name]) > target
+        except (ValueError, TypeError):
+            return False
+
+    return predicate
+
+
+_COMPILERS: Dict[str, Callable[[Dict[str, Any]], Predicate]] = {
+    "execution_latency": _compile_execution_latency,
+    "divergence_detected": _compile_divergence_detected,
+    "node_error_rate": _compile_node_error_rate,
+    "cluster_anomaly": _compile_cluster_anomaly,
+    "custom_expression": _compile_custom_expression,
+}
+
+
+def compile_condition(cond_type: str, params: Dict[str, Any]) -> Predicate:
+    """Specializes a rule condition into a closure once, hoisting its parameters out of the per-event path."""
+    compiler = _COMPILERS.get(cond_type)
+    if compiler is None:
+        logger.warning(f"[RULE] Unknown condition type '{cond_type}' never triggers.")
+        return _never
+    return compiler(params or {})
@@ -1,8 +1,7 @@
 import asyncio
-import time
 import uuid
 import logging
-from typing import List, Dict, Optional
+from typing import Dict, FrozenSet, List, Optional, Tuple
 from sqlalchemy.future import select
 
 from app.core.database import async_session_maker
@@ -12,40 +11,120 @@ logger = logging.getLogger("temporallayr.rules.store")
 
 
 class RuleStore:
-    """Enterprise rule storage backend with 30-second memory caching securely dodging active DB bounds."""
-
-    def __init__(self, cache_ttl: float = 30.0):
-        self._cache_ttl = cache_ttl
-        # Maps tenant_id -> list of active rules securely
-        self._rule_cache: Dict[str, List[RuleSchema]] = {}
-        # Maps tenant_id -> last refresh timestamp
-        self._last_refresh: Dict[str, float] = {}
+    """Enterprise rule storage backend serving compiled rules from an in-process snapshot.
+
+    A background task reloads every tenant's enabled rules in one query each refresh
+    interval and swaps the snapshot atomically, so evaluation is a plain dict lookup.
+    """
+
+    def __init__(self, refresh_interval: float = 30.0):
+        self._refresh_interval = refresh_interval
+        # Maps tenant_id -> priority-ordered rule snapshot. Replaced wholesale on refresh,
+        # so readers on the hot path never observe a partially updated mapping.
+        self._rule_cache: Dict[str, Tuple[RuleSchema, ...]] = {}
+        # Tenants present in the current snapshot; None until the first load completes.
+        # Lets the engine skip rule-less tenants without awaiting the store at all.
+        self.tenants_with_rules: Optional[FrozenSet[str]] = None
+        self._refresh_task: Optional[asyncio.Task] = None
         self._lock = asyncio.Lock()
 
-    async def get_rules_for_tenant(self, tenant_id: str) -> List[RuleSchema]:
-        """Fetch rules safely loading from cache ideally."""
-        now = time.time()
+    async def get_rules_for_tenant(self, tenant_id: str) -> Tuple[RuleSchema, ...]:
+        """Fetch rules from the in-process snapshot, loading it on first use."""
+        if self._refresh_task is None or self._refresh_task.done():
+            # Shielded so a caller-side timeout cannot abort the initial load midway
+            await asyncio.shield(self.start())
+        return self._rule_cache.get(tenant_id, ())
 
-        # Check cache validity organically
-        if tenant_id in self._rule_cache and tenant_id in self._last_refresh:
-            if (now - self._last_refresh[tenant_id]) < self._cache_ttl:
-                return self._rule_cache[tenant_id]
-
-        # Cache miss or expired: lock, re-check, fetch efficiently
+    async def start(self):
+        """Load the initial snapshot and launch the periodic refresh task."""
         async with self._lock:
-            if tenant_id in self._rule_cache and tenant_id in self._last_refresh:
-                if (now - self._last_refresh[tenant_id]) < self._cache_ttl:
-                    return self._rule_cache[tenant_id]
+            if self._refresh_task is not None and not self._refresh_task.done():
+                return
+            self._publish(await self._fetch_all_db_rules())
+            self._refresh_task = asyncio.create_task(self._refresh_loop())
+
+    async def stop(self):
+        """Cancel the refresh task; the last snapshot stays readable."""
+        if self._refresh_task:
+            self._refresh_task.cancel()
+            try:
+                await self._refresh_task
+            except asyncio.CancelledError:
+                pass
+            self._refresh_task = None
+
+    async def _refresh_loop(self):
+        while True:
+            await asyncio.sleep(self._refresh_interval)
+            try:
+                async with self._lock:
+                    self._publish(await self._fetch_all_db_rules())
+            except Exception as e:
+                logger.error(f"Rule snapshot refresh failed, keeping previous: {e}")
 
+    async def _reload_tenant(self, tenant_id: str):
+        """Swap in a fresh copy of one tenant's rules after a write, without waiting for the loop."""
+        async with self._lock:
             rules = await self._fetch_db_rules_for_tenant(tenant_id)
-            self._rule_cache[tenant_id] = rules
-            self._last_refresh[tenant_id] = time.time()
-            return rules
+            cache = dict(self._rule_cache)
+            if rules:
+                cache[tenant_id] = rules
+            else:
+                cache.pop(tenant_id, None)
+            self._publish(cache)
+
+    def _publish(self, cache: Dict[str, Tuple[RuleSchema, ...]]):
+        self._rule_cache = cache
+        self.tenants_with_rules = frozenset(cache)
+
+    @staticmethod
+    def _to_schema(r: Rule) -> RuleSchema:
+        schema = RuleSchema(
+            id=r.id,
+            tenant_id=r.tenant_id,
+            name=r.name,
+            enabled=r.enabled,
+            priority=r.priority,
+            condition=RuleCondition.model_validate(r.condition),
+            actions=RuleActions.model_validate(r.actions),
+            created_at=r.created_at,
+        )
+        # Compile at cache-fill time so the event path only ever calls closures
+        schema.predicate
+        return schema
+
+    async def _fetch_all_db_rules(self) -> Dict[str, Tuple[RuleSchema, ...]]:
+        """Loads every tenant's enabled rules in one query, grouped in priority-desc order."""
+        if not async_session_maker:
+            logger.warning("DB disconnected mapping empty rule array cleanly.")
+            return {}
+
+        try:
+            async with async_session_maker() as session:
+                stmt = (
+                    select(Rule)
+                    .where(Rule.enabled == True)
+                    .order_by(Rule.tenant_id, Rule.priority.desc())
+                )
+                result = await session.execute(stmt)
 
-    async def _fetch_db_rules_for_tenant(self, tenant_id: str) -> List[RuleSchema]:
+                grouped: Dict[str, List[RuleSchema]] = {}
+                for r in result.scalars():
+                    grouped.setdefault(r.tenant_id, []).append(self._to_schema(r))
+                return {tenant: tuple(rules) for tenant, rules in grouped.items()}
+        except Exception as e:
+            logger.error(
+                f"Failed fetching detection rules defensively organically: {e}"
+            )
+            return dict(self._rule_cache)
+
+    async def _fetch_db_rules_for_tenant(
+        self, tenant_id: str
+    ) -> Tuple[RuleSchema, ...]:
+        """Loads enabled rules in priority-desc order so evaluation needs no per-event sort or filter."""
         if not async_session_maker:
             logger.warning("DB disconnected mapping empty rule array cleanly.")
-            return []
+            return ()
 
         try:
             async with async_session_maker() as session:
@@ -55,28 +134,12 @@ class RuleStore:
                     .order_by(Rule.priority.desc())
                 )
                 result = await session.execute(stmt)
-                db_rules = result.scalars().all()
-
-                parsed = []
-                for r in db_rules:
-                    parsed.append(
-                        RuleSchema(
-                            id=r.id,
-                            tenant_id=r.tenant_id,
-                            name=r.name,
-                            enabled=r.enabled,
-                            priority=r.priority,
-                            condition=RuleCondition(**r.condition),
-                            actions=RuleActions(**r.actions),
-                            created_at=r.created_at,
-                        )
-                    )
-                return parsed
+                return tuple(self._to_schema(r) for r in result.scalars())
         except Exception as e:
             logger.error(
                 f"Failed fetching detection rules defensively organically: {e}"
             )
-            return []
+            return self._rule_cache.get(tenant_id, ())
 
     async def add_rule(self, tenant_id: str, rule_data: dict) -> Optional[RuleSchema]:
         """Insert rule dynamically evicting caches natively."""
@@ -97,9 +160,8 @@ class RuleStore:
                 await session.commit()
                 await session.refresh(new_rule)
 
-                # Invalidate cache
-                async with self._lock:
-                    self._last_refresh.pop(tenant_id, None)
+                # Publish the change to the snapshot now rather than at the next refresh
+                await self._reload_tenant(tenant_id)
 
                 return RuleSchema(
                     id=new_rule.id,
@@ -107,8 +169,8 @@ class RuleStore:
                     name=new_rule.name,
                     enabled=new_rule.enabled,
                     priority=new_rule.priority,
-                    condition=RuleCondition(**new_rule.condition),
-                    actions=RuleActions(**new_rule.actions),
+                    condition=RuleCondition.model_validate(new_rule.condition),
+                    actions=RuleActions.model_validate(new_rule.actions),
                     created_at=new_rule.created_at,
                 )
 
@@ -132,9 +194,8 @@ class RuleStore:
                 if r:
                     await session.delete(r)
                     await session.commit()
-                    # Invalidate cache organically
-                    async with self._lock:
-                        self._last_refresh.pop(tenant_id, None)
+                    # Publish the removal to the snapshot organically
+                    await self._reload_tenant(tenant_id)
                     return True
                 return False
         except Exception as e:
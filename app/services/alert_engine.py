@@ -1,32 +1,150 @@
 import asyncio
 import logging
+import time
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import httpx
 
 logger = logging.getLogger("temporallayr.alert_engine")
 
+# Cap concurrent in-flight deliveries per webhook host so one slow receiver cannot hog the pool
+_MAX_INFLIGHT_PER_HOST = 10
+
+# Global cap on concurrently delivering webhooks across all incidents (back-pressure)
+_MAX_INFLIGHT_DELIVERIES = 50
+
+# Alert rules change rarely relative to incident rate; reuse them for this long per tenant
+_ALERT_RULE_TTL = 30.0
+
+# Shared keep-alive client reused across every webhook delivery (created lazily on first use)
+_client: Optional[httpx.AsyncClient] = None
+_host_semaphores: Dict[str, asyncio.Semaphore] = {}
+_delivery_semaphore = asyncio.Semaphore(_MAX_INFLIGHT_DELIVERIES)
+
+
+class _AlertRuleIndex:
+    """Webhook URLs of a tenant's alert rules bucketed for O(1) incident matching."""
+
+    __slots__ = ("exact", "wildcard", "size")
+
+    def __init__(self, rules: List):
+        self.size = len(rules)
+        # (failure_type, node_name) -> urls for node-specific rules
+        self.exact: Dict[Tuple[str, str], List[str]] = {}
+        # failure_type -> urls for rules matching any node (node_name is None)
+        self.wildcard: Dict[str, List[str]] = {}
+        for rule in rules:
+            if not rule.webhook_url:
+                continue
+            if rule.node_name is None:
+                self.wildcard.setdefault(rule.failure_type, []).append(rule.webhook_url)
+            else:
+                self.exact.setdefault((rule.failure_type, rule.node_name), []).append(
+                    rule.webhook_url
+                )
+
+    def __bool__(self) -> bool:
+        return self.size > 0
+
+    def match(self, failure_type: str, node_name: Optional[str]) -> List[str]:
+        urls = self.wildcard.get(failure_type, [])
+        if node_name is not None:
+            exact = self.exact.get((failure_type, node_name))
+            if exact:
+                urls = urls + exact
+        return urls
+
+
+# Maps tenant_id -> (expires_at, indexed alert rules), mirroring RuleStore's snapshot cache
+_alert_rule_cache: Dict[str, Tuple[float, _AlertRuleIndex]] = {}
+_alert_rule_lock = asyncio.Lock()
+
+
+def _get_client() -> httpx.AsyncClient:
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            timeout=5.0,
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=20,
+                keepalive_expiry=30.0,
+            ),
+        )
+    return _client
+
+
+def _host_semaphore(url: str) -> asyncio.Semaphore:
+    host = urlsplit(url).netloc
+    sem = _host_semaphores.get(host)
+    if sem is None:
+        sem = _host_semaphores[host] = asyncio.Semaphore(_MAX_INFLIGHT_PER_HOST)
+    return sem
+
+
+async def close_webhook_client():
+    """Closes the shared webhook client releasing pooled keep-alive connections."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+    _host_semaphores.clear()
+
 
 async def _send_webhook(url: str, payload: dict, max_retries: int = 3):
     """Executes webhook natively with structural retries and timeouts cleanly isolating network IO."""
-    import httpx
-
     for attempt in range(max_retries):
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                response = await client.post(url, json=payload)
+            async with _host_semaphore(url):
+                response = await _get_client().post(url, json=payload)
                 response.raise_for_status()
             return True
         except Exception as e:
             logger.warning(
-                f"Webhook delivery failed natively to {url} (attempt {attempt + 1}): {e}"
+                "Webhook delivery failed natively to %s (attempt %d): %s",
+                url,
+                attempt + 1,
+                e,
             )
             if attempt < max_retries - 1:
                 await asyncio.sleep(2**attempt)  # Exponential backoff
 
     logger.error(
-        f"Failed to deliver webhook payload to {url} after {max_retries} attempts cleanly."
+        "Failed to deliver webhook payload to %s after %d attempts cleanly.",
+        url,
+        max_retries,
     )
     return False
 
 
+async def _bounded_send(url: str, payload: dict):
+    async with _delivery_semaphore:
+        return await _send_webhook(url, payload)
+
+
+async def _get_cached_alert_rules(storage, tenant_id: str) -> _AlertRuleIndex:
+    """Returns indexed tenant alert rules from a short TTL cache, querying storage only on miss/expiry."""
+    entry = _alert_rule_cache.get(tenant_id)
+    if entry and entry[0] > time.monotonic():
+        return entry[1]
+
+    async with _alert_rule_lock:
+        entry = _alert_rule_cache.get(tenant_id)
+        if entry and entry[0] > time.monotonic():
+            return entry[1]
+
+        rules = _AlertRuleIndex(await storage.get_alert_rules_for_tenant(tenant_id))
+        _alert_rule_cache[tenant_id] = (time.monotonic() + _ALERT_RULE_TTL, rules)
+        return rules
+
+
+async def invalidate_alert_rules(tenant_id: str):
+    """Evicts a tenant's cached alert rules after they are created or removed."""
+    async with _alert_rule_lock:
+        _alert_rule_cache.pop(tenant_id, None)
+
+
 async def _evaluate_and_fire_alerts(incident: dict):
     """Internal task logic cleanly decoupled from the active ingestion event loop."""
     try:
@@ -42,7 +160,7 @@ async def _evaluate_and_fire_alerts(incident: dict):
             return
 
         # Extract matching rules natively mapped to PostgreSQL structurally
-        rules = await storage.get_alert_rules_for_tenant(tenant_id)
+        rules = await _get_cached_alert_rules(storage, tenant_id)
 
         # Map simulated rules elegantly when PostgreSQL connections fail during offline tests dynamically
         if not rules and tenant_id == "dev-test-key":
@@ -52,24 +170,25 @@ async def _evaluate_and_fire_alerts(incident: dict):
                 node_name = None
                 webhook_url = "https://example.com/webhook"
 
-            rules = [MockRule()]
+            rules = _AlertRuleIndex([MockRule()])
 
-        for rule in rules:
-            if rule.failure_type == failure_type:
-                # Fire if node_name matches explicitly or rule is a wildcard (None)
-                if rule.node_name is None or rule.node_name == node_name:
-                    if rule.webhook_url:
-                        print("[ALERT ENGINE] fired")
-
-                        payload = {
-                            "incident_id": str(incident.get("id")),
-                            "summary": incident.get("summary"),
-                            "timestamp": str(incident.get("timestamp")),
-                            "tenant_id": tenant_id,
-                        }
-
-                        # Fire and forget webhook trigger natively avoiding backend crash blocks
-                        asyncio.create_task(_send_webhook(rule.webhook_url, payload))
+        payload = {
+            "incident_id": str(incident.get("id")),
+            "summary": incident.get("summary"),
+            "timestamp": str(incident.get("timestamp")),
+            "tenant_id": tenant_id,
+        }
+
+        # Fire if node_name matches explicitly or rule is a wildcard (None)
+        webhook_urls = rules.match(failure_type, node_name)
+
+        if webhook_urls:
+            print(f"[ALERT ENGINE] fired webhooks={len(webhook_urls)}")
+            # One gather per incident under a shared semaphore instead of a task per rule
+            await asyncio.gather(
+                *(_bounded_send(url, payload) for url in webhook_urls),
+                return_exceptions=True,
+            )
 
     except Exception as e:
         logger.error(
@@ -1,14 +1,40 @@
+import re
 from typing import Optional, Dict, Any
 
+# Failure signatures matched case-insensitively against metadata
+_ERROR_SIGNATURES = ("error", "exception", "traceback")
 
-async def detect_execution_failure(
-    execution: Dict[str, Any],
-) -> Optional[Dict[str, Any]]:
-    """
-    Robustly scan execution payloads natively determining if structural failures exist.
+# Single compiled alternation: one C-level scan per string, no lowered copy
+_ERROR_SIGNATURE_RE = re.compile("|".join(_ERROR_SIGNATURES), re.IGNORECASE)
+
+
+def looks_like_error(value: Any) -> bool:
+    """Walks dict values and list items matching failure signatures on string leaves only.
+
+    Keys naming a failure ("error", "exception_info", ...) count only when their value is
+    truthy, so counters such as ``{"error_count": 0}`` no longer false-positive. Avoids
+    rendering and lowercasing a full repr of the metadata per node.
     """
-    print("[FAILURE DETECTOR] checked execution")
+    if isinstance(value, str):
+        return _ERROR_SIGNATURE_RE.search(value) is not None
+    if isinstance(value, dict):
+        for key, item in value.items():
+            if (
+                item
+                and isinstance(key, str)
+                and _ERROR_SIGNATURE_RE.search(key) is not None
+            ):
+                return True
+            if looks_like_error(item):
+                return True
+        return False
+    if isinstance(value, (list, tuple)):
+        return any(looks_like_error(item) for item in value)
+    return False
+
 
+def _graph_nodes(execution: Any) -> Optional[list]:
+    """The node list the detector walks, from either a nested "graph" or the top level."""
     if not isinstance(execution, dict):
         return None
 
@@ -21,7 +47,25 @@ async def detect_execution_failure(
     else:
         nodes = execution.get("nodes", [])
 
-    if not isinstance(nodes, list):
+    return nodes if isinstance(nodes, list) else None
+
+
+def has_graph_nodes(execution: Any) -> bool:
+    """Cheap pre-check: False means detect_execution_failure_sync is certain to return None."""
+    return bool(_graph_nodes(execution))
+
+
+def detect_execution_failure_sync(
+    execution: Dict[str, Any], tenant_id: Optional[str] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Robustly scan execution payloads natively determining if structural failures exist.
+
+    Pure CPU work with no awaits, so batches can be offloaded to an executor. ``tenant_id``
+    is used when the payload itself does not carry one.
+    """
+    nodes = _graph_nodes(execution)
+    if not nodes:
         return None
 
     for node in nodes:
@@ -32,13 +76,11 @@ async def detect_execution_failure(
         if not isinstance(metadata, dict):
             continue
 
-        # Inspect metadata for standard failure signatures natively converting mapping to lowercase string
-        meta_str = str(metadata).lower()
-
-        if "error" in meta_str or "exception" in meta_str or "traceback" in meta_str:
+        # Inspect metadata for standard failure signatures natively via a typed walk
+        if looks_like_error(metadata):
             # Reconstruct incident dictionary cleanly
             return {
-                "tenant_id": execution.get("tenant_id", "unknown"),
+                "tenant_id": execution.get("tenant_id") or tenant_id or "unknown",
                 "execution_id": execution.get("execution_id")
                 or execution.get("id", "unknown"),
                 "timestamp": node.get("created_at")
@@ -49,3 +91,10 @@ async def detect_execution_failure(
             }
 
     return None
+
+
+async def detect_execution_failure(
+    execution: Dict[str, Any],
+) -> Optional[Dict[str, Any]]:
+    """Async wrapper around detect_execution_failure_sync for existing callers."""
+    return detect_execution_failure_sync(execution)
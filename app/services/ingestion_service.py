@@ -1,26 +1,118 @@
 import asyncio
+import hashlib
 import logging
-from typing import Any, Dict, List
-from datetime import datetime, UTC
-
+import uuid
+from collections import deque
+from functools import lru_cache
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple
+from datetime import datetime, timedelta, UTC
+
+from sqlalchemy import bindparam, insert, select, tuple_, update
+
+from app.core.database import async_session_maker
+from app.core.event_stream import EventStream
+from app.models.event import Incident
+from app.rules.engine import rule_engine
+from app.rules.store import rule_store
+from app.services.alert_engine import close_webhook_client, process_incident
+from app.services.failure_detector import (
+    detect_execution_failure_sync,
+    has_graph_nodes,
+)
 from app.services.storage_service import StorageService
+from app.stream.stream_manager import stream_manager_v2
 
 logger = logging.getLogger("temporallayr.ingestion")
 
+# Bulk insert budget per batch: a fixed allowance plus a per-event share, so a larger
+# configured max_batch_size is not cut off by a deadline sized for small batches
+INSERT_TIMEOUT_BASE = 10.0
+INSERT_TIMEOUT_PER_EVENT = 0.002
+# Rule evaluation gets 50ms per event up to this ceiling, so one slow batch cannot hold
+# the worker for long; events left unevaluated are logged rather than retried
+RULE_TIMEOUT_PER_EVENT = 0.05
+RULE_TIMEOUT_MAX = 1.0
+
+
+@lru_cache(maxsize=4096)
+def _incident_fingerprint(failure_type: str, node_name: str) -> str:
+    """128-bit BLAKE2b grouping key for a failure path, cached since distinct paths are few.
+
+    The parts are joined with the 0x1F unit separator so "a:b" + "c" and "a" + "b:c" no
+    longer share a fingerprint. Not a security boundary: 32 hex chars keep the fingerprint
+    index half the width of the previous SHA-256 digests.
+    """
+    return hashlib.blake2b(
+        f"{failure_type}\x1f{node_name}".encode("utf-8"), digest_size=16
+    ).hexdigest()
+
+
+async def _broadcast_all(manager, broadcasts: List[Tuple[str, Dict[str, Any]]]):
+    """Deliver a batch's WebSocket events as one frame per (tenant, event type).
+
+    Grouping keeps first-seen order, so a tenant still receives its event types in the
+    order the batch produced them.
+    """
+    grouped: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+    for tenant_id, event in broadcasts:
+        grouped.setdefault((tenant_id, event["type"]), []).append(event)
+
+    for (tenant_id, event_type), events in grouped.items():
+        try:
+            await manager.broadcast_events(tenant_id, event_type, events)
+        except Exception as e:
+            logger.error("[STREAM] batch broadcast failed: %s", e)
+
+
+class _QueuedEvent:
+    """Slotted queue entry: no per-item __dict__, about a third the size of the old wrapper dict.
+
+    get() mirrors the dict lookups StorageService and ad-hoc callers already perform, so
+    plain {"tenant_id", "event"} dicts remain valid batch items.
+    """
+
+    __slots__ = ("tenant_id", "event", "ingested_at")
+
+    def __init__(self, tenant_id: str, event: Dict[str, Any], ingested_at: datetime):
+        self.tenant_id = tenant_id
+        self.event = event
+        self.ingested_at = ingested_at
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key, default)
+
 
 class IngestionService:
-    def __init__(self, max_batch_size: int = 500, flush_interval: float = 2.0):
+    def __init__(
+        self,
+        max_batch_size: int = 1000,
+        flush_interval: float = 1.0,
+        max_queue_size: int = 10000,
+        max_background_tasks: int = 5000,
+    ):
         self.max_batch_size = max_batch_size
         self.flush_interval = flush_interval
-        self._queue: asyncio.Queue | None = None
+        self.max_queue_size = max_queue_size
+        self.max_background_tasks = max_background_tasks
+        # Plain deque signalled by events: producers append synchronously and the worker
+        # drains whole runs of items without a future per get()
+        self._queue: Deque[_QueuedEvent] | None = None
+        self._not_empty: asyncio.Event | None = None
+        self._not_full: asyncio.Event | None = None
+        self._flush_due = False
         self._worker_task: asyncio.Task | None = None
         self._is_running = False
         self._storage = StorageService(max_retries=3, base_delay=1.0)
+        self._background_tasks: Set[asyncio.Task] = set()
+        self._stream = EventStream()
 
     async def start(self):
         """Start the background ingestion worker."""
         if not self._is_running:
-            self._queue = asyncio.Queue(maxsize=10000)
+            self._queue = deque()
+            self._not_empty = asyncio.Event()
+            self._not_full = asyncio.Event()
+            self._not_full.set()
             self._is_running = True
             logger.info("IngestionService background worker starting...")
             self._worker_task = asyncio.create_task(self._process_queue())
@@ -38,193 +130,312 @@ class IngestionService:
                     pass
 
             # Final flush
-            remaining = []
-            while not self._queue.empty():
-                try:
-                    remaining.append(self._queue.get_nowait())
-                except asyncio.QueueEmpty:
-                    break
+            remaining = list(self._queue)
+            self._queue.clear()
+            self._not_full.set()
 
             if remaining:
                 await self._write_batch(remaining)
+
+            await close_webhook_client()
             logger.info("IngestionService stopped gracefully.")
 
     async def enqueue(self, tenant_id: str, events: List[Dict[str, Any]]):
         """Enqueue an array of loosely structured telemetry events mapped to a specific tenant."""
+        # Backpressure: hold the request while the buffer is at capacity. A request admitted
+        # just under the limit may overshoot it by its own size, never more.
+        while len(self._queue) >= self.max_queue_size:
+            self._not_full.clear()
+            await self._not_full.wait()
+
+        # Force server-side receipt timestamps; one clock read per request batch. The parsed
+        # datetime rides along on the item so storage never re-parses the ISO string.
+        now = datetime.now(UTC)
+        now_iso = now.isoformat()
         for event in events:
-            # Force server-side receipt timestamps
-            event["_ingested_at"] = datetime.now(UTC).isoformat()
-            await self._queue.put({"tenant_id": tenant_id, "event": event})
+            event["_ingested_at"] = now_iso
+        self._queue.extend(_QueuedEvent(tenant_id, event, now) for event in events)
+        if self._queue:
+            self._not_empty.set()
+
+    def _drain_into(self, batch: List[Dict[str, Any]]) -> None:
+        """Move already-queued items into the batch without yielding, up to max_batch_size."""
+        room = self.max_batch_size - len(batch)
+        if len(self._queue) <= room:
+            batch.extend(self._queue)
+            self._queue.clear()
+        else:
+            popleft = self._queue.popleft
+            batch.extend(popleft() for _ in range(room))
+        if len(self._queue) < self.max_queue_size:
+            self._not_full.set()
+
+    async def _wait_for_items(self) -> None:
+        """Park until a producer signals new items or the flush timer fires."""
+        if self._queue or self._flush_due:
+            return
+        self._not_empty.clear()
+        await self._not_empty.wait()
+
+    def _on_flush_timer(self) -> None:
+        """Flush deadline callback: mark the partial batch due and wake the worker."""
+        self._flush_due = True
+        self._not_empty.set()
 
     async def _process_queue(self):
         """Background coroutine processing items into storage backend bindings."""
         batch = []
-        last_flush = asyncio.get_event_loop().time()
+        loop = asyncio.get_running_loop()
 
         while self._is_running:
             try:
-                # Calculate time remaining until next explicit flush trigger threshold
-                now = asyncio.get_event_loop().time()
-                timeout = max(0, self.flush_interval - (now - last_flush))
-
-                # Wait for item or explicit flush timer iteration
-                try:
-                    item = await asyncio.wait_for(self._queue.get(), timeout=timeout)
-                    batch.append(item)
-                    self._queue.task_done()
-                except asyncio.TimeoutError:
-                    pass  # Timer hit, proceed to explicit flush checks
-
-                if (
-                    len(batch) >= self.max_batch_size
-                    or (asyncio.get_event_loop().time() - last_flush)
-                    >= self.flush_interval
-                ):
-                    if batch:
-                        success = await self._write_batch(batch)
-                        if success:
-                            batch.clear()
-                        else:
-                            logger.warning(
-                                f"Batch write failed. Backing off for 5s and retaining {len(batch)} events."
-                            )
-                            await asyncio.sleep(5)
-                    last_flush = asyncio.get_event_loop().time()
+                # Block only while idle; an idle worker costs nothing
+                if not batch:
+                    await self._wait_for_items()
+
+                # Drain whatever is already queued in one pass. A partial batch arms a
+                # single call_later handle that wakes the worker at the flush deadline, so
+                # no wait_for task or deadline arithmetic runs per wake-up.
+                self._drain_into(batch)
+                if len(batch) < self.max_batch_size:
+                    self._flush_due = False
+                    flush_handle = loop.call_later(
+                        self.flush_interval, self._on_flush_timer
+                    )
+                    try:
+                        while len(batch) < self.max_batch_size and not self._flush_due:
+                            await self._wait_for_items()
+                            self._drain_into(batch)
+                    finally:
+                        flush_handle.cancel()
+                        self._flush_due = False
+
+                success = await self._write_batch(batch)
+                if success:
+                    batch = []
+                else:
+                    logger.warning(
+                        "Batch write failed. Backing off for 5s and retaining %d events.",
+                        len(batch),
+                    )
+                    await asyncio.sleep(5)
 
             except asyncio.CancelledError:
                 break
-            except Exception as e:
-                import traceback
-
-                print(f"[FATAL] Worker exception: {e}")
-                traceback.print_exc()
-                logger.error(f"Error in background ingestion worker: {e}")
+            except Exception:
+                # Traceback goes through logging rather than a direct stderr write
+                logger.exception("Error in background ingestion worker")
                 await asyncio.sleep(1)  # Prevent rapid spin on generic crash
 
+    async def _spawn_background(self, coro) -> asyncio.Task:
+        """Start a fire-and-forget task, first waiting for room above the high-water mark."""
+        if len(self._background_tasks) >= self.max_background_tasks:
+            logger.warning(
+                "%d background tasks in flight; waiting for one to finish",
+                len(self._background_tasks),
+            )
+            await asyncio.wait(
+                self._background_tasks,
+                timeout=1.0,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+        task = asyncio.create_task(coro)
+        # Hold a strong reference so the loop cannot collect the task mid-flight
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+        return task
+
+    @staticmethod
+    def _discard(future: Optional[asyncio.Future]) -> None:
+        """Drop an executor result the batch will not use; the kept batch re-runs it on retry.
+
+        Cancelling stops work that has not started yet. A future that already finished has
+        its exception retrieved, so a detector fault is logged once here rather than as
+        "Future exception was never retrieved".
+        """
+        if future is None or future.cancel():
+            return
+        if not future.cancelled() and future.exception() is not None:
+            logger.error("Discarded failure detection errored: %s", future.exception())
+
     async def _write_batch(self, batch: List[Dict[str, Any]]) -> bool:
         """Write a batch of events reliably to secondary storage through structured backend routing.
         Stream publication is fire-and-forget and always fires, regardless of storage success.
         """
-        from app.core.event_stream import EventStream
-        from app.services.failure_detector import detect_execution_failure
-        from app.core.database import async_session_maker
-        from app.models.event import Incident
-        from datetime import datetime, UTC
+        stream = self._stream
 
-        stream = EventStream()
+        # One clock read per batch; reused for stream notices and every missing-timestamp fallback
+        batch_now = datetime.now(UTC)
+        now_iso = batch_now.isoformat()
 
-        # Publish to live stream immediately — non-blocking, independent of DB outcome
+        # Publish to live stream immediately — non-blocking, independent of DB outcome.
+        # One task per batch rather than one per event keeps scheduler churn flat, and
+        # one notice per (tenant, execution): start/step/end events of a run often share a batch.
+        ingested: Dict[Tuple[str, Any], Dict[str, Any]] = {}
         for item in batch:
             event_payload = item.get("event", {})
             exec_id = event_payload.get("execution_id") or event_payload.get("id")
             tenant_id = item.get("tenant_id")
 
             if exec_id and tenant_id:
-                asyncio.create_task(
-                    stream.publish(
-                        {
-                            "type": "execution_ingested",
-                            "execution_id": exec_id,
-                            "tenant_id": tenant_id,
-                            "timestamp": datetime.now(UTC).isoformat(),
-                        }
-                    )
-                )
+                ingested[(tenant_id, exec_id)] = {
+                    "type": "execution_ingested",
+                    "execution_id": exec_id,
+                    "tenant_id": tenant_id,
+                    "timestamp": now_iso,
+                }
+        messages = list(ingested.values())
+
+        if messages:
+            await self._spawn_background(stream.publish_many(messages))
 
         # Persist to storage backend (best-effort; failure does not block the stream)
         logger.info(
-            f"Dispatching {len(batch)} queued events into PostgreSQL storage backend natively..."
+            "Dispatching %d queued events into PostgreSQL storage backend natively...",
+            len(batch),
         )
+        # Run failure detection on the default executor while the insert is in flight,
+        # so batch wall time is roughly max(insert, detect) rather than their sum. Batches
+        # with no graph nodes at all (plain log events) cannot yield a detector incident
+        # and skip the executor hop.
+        detections = None
+        if any(has_graph_nodes(item.get("event")) for item in batch):
+            detections = asyncio.get_running_loop().run_in_executor(
+                None,
+                lambda: [
+                    detect_execution_failure_sync(
+                        item.get("event", {}), item.get("tenant_id")
+                    )
+                    for item in batch
+                ],
+            )
+
+        insert_timeout = INSERT_TIMEOUT_BASE + INSERT_TIMEOUT_PER_EVENT * len(batch)
         try:
             success = await asyncio.wait_for(
-                self._storage.bulk_insert_events(batch), timeout=10.0
+                self._storage.bulk_insert_events(batch), timeout=insert_timeout
             )
             if not success:
                 logger.error(
                     "Failed persisting batch cleanly via storage backend layer boundaries. Halting batch to preserve events."
                 )
+                self._discard(detections)
                 return False
         except asyncio.TimeoutError:
             logger.error(
-                "DB bulk insert timed out after 10s. Halting batch to preserve events."
+                "DB bulk insert timed out after %.1fs. Halting batch to preserve events.",
+                insert_timeout,
             )
+            self._discard(detections)
             return False
 
-        from app.stream.stream_manager import stream_manager_v2
-        from app.rules.engine import rule_engine
+        known_tenants = rule_store.tenants_with_rules
 
-        # Explicitly map execution anomaly engine structurally validating stored boundaries
+        incident_results = await detections if detections else [None] * len(batch)
+        pending_incidents: List[Dict[str, Any]] = []
+        # WebSocket fan-out collected per batch and delivered grouped after the loop
+        broadcasts: List[Tuple[str, Dict[str, Any]]] = []
+        # Broadcast slot of each execution's graph frame, keyed by (tenant, execution): the
+        # slot is reserved where the execution first appears, keeping frames in batch order,
+        # and the last event of the execution wins it; every event is still persisted and
+        # checked for incidents
+        graph_slots: Dict[Tuple[str, Any], int] = {}
+
+        payloads = []
         for item in batch:
             event_payload = item.get("event", {})
             # Natively bind tenant isolation tracing directly into payload for inspection
             if "tenant_id" not in event_payload and item.get("tenant_id"):
                 event_payload["tenant_id"] = item.get("tenant_id")
+            payloads.append(event_payload)
+
+        # 1. Automatic Dynamic Detection Rules Engine (Enterprise Safety), one pass per batch.
+        # Rule-less batches skip the wait_for task entirely.
+        rule_results = [None] * len(payloads)
+        if known_tenants is None or any(
+            p.get("tenant_id") in known_tenants for p in payloads
+        ):
+            try:
+                rule_results = await asyncio.wait_for(
+                    rule_engine.evaluate_events(payloads),
+                    timeout=min(
+                        RULE_TIMEOUT_PER_EVENT * len(payloads), RULE_TIMEOUT_MAX
+                    ),
+                )
+            except asyncio.TimeoutError:
+                skipped = (
+                    len(payloads)
+                    if known_tenants is None
+                    else sum(p.get("tenant_id") in known_tenants for p in payloads)
+                )
+                logger.error(
+                    "[RULE] evaluation timed out; skipped rules for %d events.", skipped
+                )
+            except Exception as e:
+                logger.error("[RULE] evaluation failed robustly natively: %s", e)
 
-            # 1. Automatic Dynamic Detection Rules Engine (Enterprise Safety)
+        # Explicitly map execution anomaly engine structurally validating stored boundaries
+        for item, event_payload, detected_incident, result in zip(
+            batch, payloads, incident_results, rule_results
+        ):
             rule_incident = None
             try:
-                # 50ms timeout bounds isolating main arrays completely safely from generic DB locks
-                result = await asyncio.wait_for(
-                    rule_engine.evaluate_event(event_payload), timeout=0.05
-                )
                 if result and result.rule.actions.create_incident:
                     # Construct structural trace bridging engine maps organically
                     rule_incident = {
                         "tenant_id": event_payload["tenant_id"],
                         "execution_id": event_payload.get("execution_id")
                         or event_payload.get("id", "unknown"),
-                        "timestamp": event_payload.get(
-                            "_ingested_at", datetime.utcnow().isoformat()
-                        ),
+                        "timestamp": event_payload.get("_ingested_at", now_iso),
                         "failure_type": result.rule.condition.type,
                         "node_name": event_payload.get("node", "analyzer"),
                         "summary": f"Detected anomaly matching rule: {result.rule.name}",
                     }
-                    print(
-                        f"[RULE] triggered incident proactively logic='{result.rule.name}'"
+                    logger.debug(
+                        "[RULE] triggered incident proactively logic='%s'",
+                        result.rule.name,
                     )
-                    asyncio.create_task(
-                        stream_manager_v2.broadcast_event(
+                    broadcasts.append(
+                        (
                             event_payload["tenant_id"],
                             {
                                 "type": "rule_triggered",
-                                "timestamp": event_payload.get(
-                                    "_ingested_at", datetime.utcnow().isoformat()
-                                ),
+                                "timestamp": event_payload.get("_ingested_at", now_iso),
                                 "payload": rule_incident,
                             },
                         )
                     )
-            except asyncio.TimeoutError:
-                logger.error("[RULE] evaluation timeout bounds exceeded safe.")
             except Exception as e:
-                logger.error(f"[RULE] evaluation failed robustly natively: {e}")
+                logger.error("[RULE] evaluation failed robustly natively: %s", e)
 
             # 2. Legacy Base Anomaly Extractor
-            incident_data = rule_incident or await detect_execution_failure(
-                event_payload
-            )
+            incident_data = rule_incident or detected_incident
 
             # Use ingestion arrival times parsing correctly
-            ts_str = event_payload.get("_ingested_at", datetime.utcnow().isoformat())
+            ts_str = event_payload.get("_ingested_at", now_iso)
 
             is_incident = incident_data is not None
 
-            # Unconditionally broadcast across real-time WebSockets isolated from core loops organically
-            asyncio.create_task(
-                stream_manager_v2.broadcast_event(
-                    item.get("tenant_id"),
-                    {
-                        "type": "execution_graph",
-                        "timestamp": ts_str,
-                        "payload": event_payload,
-                    },
-                )
-            )
+            # Broadcast across real-time WebSockets isolated from core loops organically
+            graph_frame = {
+                "type": "execution_graph",
+                "timestamp": ts_str,
+                "payload": event_payload,
+            }
+            exec_id = event_payload.get("execution_id") or event_payload.get("id")
+            frame_key = (item.get("tenant_id"), exec_id)
+            slot = graph_slots.get(frame_key) if exec_id else None
+            if slot is not None:
+                # A later event of the same execution replaces the frame in its slot
+                broadcasts[slot] = (frame_key[0], graph_frame)
+            else:
+                if exec_id:
+                    graph_slots[frame_key] = len(broadcasts)
+                broadcasts.append((frame_key[0], graph_frame))
 
             if is_incident:
-                asyncio.create_task(
-                    stream_manager_v2.broadcast_event(
+                broadcasts.append(
+                    (
                         item.get("tenant_id"),
                         {
                             "type": "incident_created",
@@ -235,94 +446,175 @@ class IngestionService:
                 )
 
             if incident_data:
-                exec_id = incident_data["execution_id"]
+                # Rule incidents are stamped with the receipt time enqueue already holds as a
+                # datetime; only detector incidents carry a producer string that needs parsing.
+                dt = item.get("ingested_at") if rule_incident else None
+                if dt is None:
+                    # fromisoformat accepts a trailing "Z" natively on 3.11+, so no rewrite is needed
+                    ts_str = incident_data.get("timestamp")
+                    try:
+                        dt = datetime.fromisoformat(ts_str) if ts_str else batch_now
+                    except (TypeError, ValueError):
+                        dt = batch_now
+                    if dt.tzinfo is None:
+                        dt = dt.replace(tzinfo=UTC)  # Naive producer timestamps are UTC
 
-                # Transform robust chronological constraints tightly handling UTC conversions
-                ts_str = incident_data.get("timestamp")
-                try:
-                    dt = (
-                        datetime.fromisoformat(ts_str.replace("Z", "+00:00"))
-                        if ts_str
-                        else datetime.utcnow()
-                    )
-                except ValueError:
-                    dt = datetime.utcnow()
+                # Natively map fingerprint bounds uniquely locking identical error paths
+                failure_type = incident_data.get("failure_type", "")
+                node_name = incident_data.get("node_name", "")
+                pending_incidents.append(
+                    {
+                        "data": incident_data,
+                        "timestamp": dt,
+                        "fp_raw": f"{failure_type}:{node_name}",
+                        "fingerprint": _incident_fingerprint(failure_type, node_name),
+                    }
+                )
 
-                import hashlib
-                from datetime import timedelta
-                from sqlalchemy import select
+        await _broadcast_all(stream_manager_v2, broadcasts)
 
-                # Natively map fingerprint bounds uniquely locking identical error paths
-                fp_raw = f"{incident_data.get('failure_type', '')}:{incident_data.get('node_name', '')}"
-                fingerprint = hashlib.sha256(fp_raw.encode("utf-8")).hexdigest()
+        if pending_incidents:
+            await self._persist_incidents(pending_incidents)
 
-                if async_session_maker:
-                    try:
-                        async with async_session_maker() as session:
-                            # Search for an active incident mapped to this tenant within the last 24 hours natively
-                            twenty_four_hours_ago = dt - timedelta(hours=24)
-
-                            stmt = (
-                                select(Incident)
-                                .where(Incident.tenant_id == incident_data["tenant_id"])
-                                .where(Incident.fingerprint == fingerprint)
-                                .where(Incident.timestamp >= twenty_four_hours_ago)
-                                .order_by(Incident.timestamp.desc())
-                                .limit(1)
-                            )
-
-                            existing_incident = None
-                            try:
-                                result = await session.execute(stmt)
-                                existing_incident = result.scalar_one_or_none()
-                            except Exception as db_err:
-                                logger.warning(
-                                    f"DB offline/unreachable for incident grouping natively: {db_err}"
-                                )
-
-                            if existing_incident:
-                                # Safe native isolation bounds mapping aggregates sequentially
-                                existing_incident.occurrence_count += 1
-                                existing_incident.timestamp = dt
-                                print(f"[INCIDENT GROUPED] {fp_raw}")
-                            else:
-                                new_incident = Incident(
-                                    tenant_id=incident_data["tenant_id"],
-                                    execution_id=exec_id,
-                                    timestamp=dt,
-                                    failure_type=incident_data["failure_type"],
-                                    node_name=incident_data["node_name"],
-                                    summary=incident_data["summary"],
-                                    fingerprint=fingerprint,
-                                    occurrence_count=1,
-                                )
-                                session.add(new_incident)
-                                print(f"[INCIDENT CREATED] {exec_id}")
-
-                            await session.commit()
-
-                            # Fire webhooks strictly on novel incidents natively isolating spam mappings
-                            if not existing_incident:
-                                from app.services.alert_engine import process_incident
-
-                                payload = {
-                                    "id": str(new_incident.id),
-                                    "tenant_id": new_incident.tenant_id,
-                                    "failure_type": new_incident.failure_type,
-                                    "node_name": new_incident.node_name,
-                                    "summary": new_incident.summary,
-                                    "timestamp": new_incident.timestamp,
-                                }
-                                await process_incident(payload)
-
-                    except Exception as e:
-                        logger.error(
-                            f"Failed persisting localized incidents securely to database: {e}"
+        return True
+
+    async def _persist_incidents(self, incidents: List[Dict[str, Any]]) -> None:
+        """Group a batch's incidents by fingerprint and persist them in one transaction.
+
+        Occurrences sharing a (tenant, fingerprint) collapse in memory first, one SELECT finds
+        active incidents from the last 24 hours, and the remaining writes go out as Core
+        executemany UPDATE/INSERT statements rather than per-row ORM flushes.
+        """
+        if not async_session_maker:
+            for pending in incidents:
+                logger.debug(
+                    "[INCIDENT OFFLINE] %s (Fingerprint: %s)",
+                    pending["data"]["execution_id"],
+                    pending["fingerprint"],
+                )
+            return
+
+        # First occurrence anchors the lookup window; later ones only bump the count,
+        # matching what sequential per-event grouping would have produced
+        groups: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        for pending in incidents:
+            key = (pending["data"]["tenant_id"], pending["fingerprint"])
+            group = groups.get(key)
+            if group is None:
+                groups[key] = {**pending, "count": 1, "latest": pending["timestamp"]}
+            else:
+                group["count"] += 1
+                group["latest"] = pending["timestamp"]
+
+        table = Incident.__table__
+        try:
+            async with async_session_maker() as session:
+                # Search for active incidents mapped to these tenants within the last 24 hours natively
+                existing: Dict[Tuple[str, str], Any] = {}
+                # One row-value IN over every key with the widest window; DISTINCT ON keeps the
+                # newest row per key, which is then checked against that key's own window
+                window_start = min(
+                    group["timestamp"] for group in groups.values()
+                ) - timedelta(hours=24)
+                lookup = (
+                    select(
+                        table.c.id,
+                        table.c.tenant_id,
+                        table.c.fingerprint,
+                        table.c.timestamp,
+                    )
+                    .where(
+                        tuple_(table.c.tenant_id, table.c.fingerprint).in_(
+                            list(groups)
+                        ),
+                        table.c.timestamp >= window_start,
+                    )
+                    .distinct(table.c.tenant_id, table.c.fingerprint)
+                    .order_by(
+                        table.c.tenant_id,
+                        table.c.fingerprint,
+                        table.c.timestamp.desc(),
+                    )
+                )
+                try:
+                    result = await session.execute(lookup)
+                    for row in result:
+                        key = (row.tenant_id, row.fingerprint)
+                        if row.timestamp >= groups[key]["timestamp"] - timedelta(
+                            hours=24
+                        ):
+                            existing[key] = row.id
+                except Exception as db_err:
+                    logger.warning(
+                        "DB offline/unreachable for incident grouping natively: %s",
+                        db_err,
+                    )
+
+                grouped_rows = []
+                new_rows = []
+                for key, group in groups.items():
+                    if key in existing:
+                        grouped_rows.append(
+                            {
+                                "b_id": existing[key],
+                                "b_count": group["count"],
+                                "b_timestamp": group["latest"],
+                            }
                         )
-                        print(
-                            f"[INCIDENT OFFLINE] {exec_id} (Fingerprint: {fingerprint})"
+                        logger.debug("[INCIDENT GROUPED] %s", group["fp_raw"])
+                    else:
+                        data = group["data"]
+                        new_rows.append(
+                            {
+                                "id": uuid.uuid4(),
+                                "tenant_id": data["tenant_id"],
+                                "execution_id": data["execution_id"],
+                                "timestamp": group["latest"],
+                                "failure_type": data["failure_type"],
+                                "node_name": data["node_name"],
+                                "summary": data["summary"],
+                                "fingerprint": group["fingerprint"],
+                                "occurrence_count": group["count"],
+                            }
                         )
-                else:
-                    print(f"[INCIDENT OFFLINE] {exec_id} (Fingerprint: {fingerprint})")
+                        logger.debug("[INCIDENT CREATED] %s", data["execution_id"])
+
+                if grouped_rows:
+                    await session.execute(
+                        update(table)
+                        .where(table.c.id == bindparam("b_id"))
+                        .values(
+                            occurrence_count=table.c.occurrence_count
+                            + bindparam("b_count"),
+                            timestamp=bindparam("b_timestamp"),
+                        ),
+                        grouped_rows,
+                    )
+                if new_rows:
+                    await session.execute(insert(table), new_rows)
 
-        return True
+                await session.commit()
+        except Exception as e:
+            logger.error(
+                "Failed persisting localized incidents securely to database: %s", e
+            )
+            for group in groups.values():
+                logger.debug(
+                    "[INCIDENT OFFLINE] %s (Fingerprint: %s)",
+                    group["data"]["execution_id"],
+                    group["fingerprint"],
+                )
+            return
+
+        # Fire webhooks strictly on novel incidents natively isolating spam mappings
+        for row in new_rows:
+            await process_incident(
+                {
+                    "id": str(row["id"]),
+                    "tenant_id": row["tenant_id"],
+                    "failure_type": row["failure_type"],
+                    "node_name": row["node_name"],
+                    "summary": row["summary"],
+                    "timestamp": row["timestamp"],
+                }
+            )
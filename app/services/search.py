@@ -1,14 +1,62 @@
 import logging
+from functools import lru_cache
 from typing import Optional, List, Dict, Any
 from datetime import datetime
-from sqlalchemy import select
+from sqlalchemy import DateTime, String, bindparam, select, tuple_
 
 from app.core.database import async_session_maker
 from app.models.event import ExecutionSummary
+from app.query.engine import decode_cursor, encode_cursor
 
 logger = logging.getLogger("temporallayr.search")
 
 
+# Only the filter shape varies between calls, so each of the sixteen shapes is built once
+# and every value (tenant, bounds, node name, paging) is passed as a bound parameter.
+@lru_cache(maxsize=16)
+def _build_search_statement(
+    has_start: bool, has_end: bool, has_function: bool, has_cursor: bool
+):
+    # 1. Base query against lightweight summaries natively tracking graphs; only the
+    # response columns are selected, so rows come back as plain tuples, not ORM objects
+    stmt = select(
+        ExecutionSummary.id,
+        ExecutionSummary.created_at,
+        ExecutionSummary.node_count,
+    ).where(ExecutionSummary.tenant_id == bindparam("tenant_id"))
+
+    # 2. Add time range bounds if requested
+    if has_start:
+        stmt = stmt.where(ExecutionSummary.created_at >= bindparam("start_time"))
+    if has_end:
+        stmt = stmt.where(ExecutionSummary.created_at <= bindparam("end_time"))
+
+    # 3. Match graph nodes by name in SQL via the ix_execsum_nodenames GIN index
+    if has_function:
+        stmt = stmt.where(
+            # Typed as text: jsonb ? text is the key-exists operator the index serves
+            ExecutionSummary.node_names.op("?")(
+                bindparam("function_name", type_=String)
+            )
+        )
+
+    # 4. Order newest first strictly (id tie-breaker matches ix_execs_tenant_created) and
+    # paginate natively: a cursor seeks past the previous page's last (created_at, id)
+    # instead of rescanning every offset row
+    stmt = stmt.order_by(
+        ExecutionSummary.created_at.desc(), ExecutionSummary.id.desc()
+    ).limit(bindparam("limit"))
+    if has_cursor:
+        return stmt.where(
+            tuple_(ExecutionSummary.created_at, ExecutionSummary.id)
+            < tuple_(
+                bindparam("after_created_at", type_=DateTime(timezone=True)),
+                bindparam("after_id", type_=String),
+            )
+        )
+    return stmt.offset(bindparam("offset"))
+
+
 async def search_executions(
     tenant_id: str,
     function_name: Optional[str],
@@ -16,93 +64,64 @@ async def search_executions(
     end_time: Optional[datetime],
     limit: int,
     offset: int,
+    cursor: Optional[str] = None,
 ) -> List[Dict[str, Any]]:
     """
     Search executions functionally mapping criteria over execution storage backend securely.
     Always filters by tenant_id aggressively.
     Order is newest first natively.
+    ``cursor`` (see search_next_cursor) takes precedence over ``offset`` when valid.
     """
-    print("[SEARCH] executed query")
+    logger.debug("[SEARCH] executed query tenant=%s", tenant_id)
 
     if not async_session_maker:
         return _mock_search_fallback(tenant_id, function_name, offset, limit)
 
     try:
-        from app.services.storage_service import StorageService
-
-        storage = StorageService()
-
         async with async_session_maker() as session:
-            # 1. Base query against lightweight summaries natively tracking graphs
-            stmt = select(ExecutionSummary).where(
-                ExecutionSummary.tenant_id == tenant_id
+            boundary = decode_cursor(cursor, id_type=str) if cursor else None
+            stmt = _build_search_statement(
+                start_time is not None,
+                end_time is not None,
+                bool(function_name),
+                boundary is not None,
             )
-
-            # 2. Add time range bounds if requested
-            if start_time:
-                stmt = stmt.where(ExecutionSummary.created_at >= start_time)
-            if end_time:
-                stmt = stmt.where(ExecutionSummary.created_at <= end_time)
-
-            # 3. Order newest first strictly
-            stmt = stmt.order_by(ExecutionSummary.created_at.desc())
-
-            # 4. Handle pagination natively when deep graph function_name inspection isn't required
-            if not function_name:
-                stmt = stmt.limit(limit).offset(offset)
-                result = await session.execute(stmt)
-                return [
-                    {
-                        "id": summary.id,
-                        "created_at": summary.created_at.isoformat()
-                        if summary.created_at
-                        else "",
-                        "node_count": summary.node_count,
-                    }
-                    for summary in result.scalars()
-                ]
-
-            # 5. Handle full graph inspection conditionally matching `function_name` inside payload structures
-            result = await session.execute(stmt)
-            candidates = result.scalars().all()
-
-            matched_results = []
-            for summary in candidates:
-                graph = await storage.get_execution(
-                    tenant_id=tenant_id, execution_id=summary.id
-                )
-                if not graph:
-                    continue
-
-                nodes = graph.get("nodes", [])
-                has_function = False
-                if isinstance(nodes, list):
-                    for n in nodes:
-                        name = n if isinstance(n, str) else n.get("name", "")
-                        if name == function_name:
-                            has_function = True
-                            break
-
-                if has_function:
-                    matched_results.append(
-                        {
-                            "id": summary.id,
-                            "created_at": summary.created_at.isoformat()
-                            if summary.created_at
-                            else "",
-                            "node_count": summary.node_count,
-                        }
-                    )
-
-            # 6. Post filter pagination slicing directly matching candidates
-            return matched_results[offset : offset + limit]
+            params = {"tenant_id": tenant_id, "limit": limit}
+            if boundary is None:
+                params["offset"] = offset
+            else:
+                params["after_created_at"], params["after_id"] = boundary
+            if start_time is not None:
+                params["start_time"] = start_time
+            if end_time is not None:
+                params["end_time"] = end_time
+            if function_name:
+                params["function_name"] = function_name
+
+            result = await session.execute(stmt, params)
+            return [
+                {
+                    "id": row.id,
+                    "created_at": row.created_at.isoformat() if row.created_at else "",
+                    "node_count": row.node_count,
+                }
+                for row in result
+            ]
 
     except Exception as e:
         # Catch SQLAlchemy connection errors (e.g. Postgres down locally) and use fallback
-        logger.error(f"Error executing structured execution search gracefully: {e}")
+        logger.error("Error executing structured execution search gracefully: %s", e)
         return _mock_search_fallback(tenant_id, function_name, offset, limit)
 
 
+def search_next_cursor(results: List[Dict[str, Any]], limit: int) -> Optional[str]:
+    """Cursor for the page after a search_executions result; None once a page comes back short."""
+    if not results or len(results) < limit:
+        return None
+    last = results[-1]
+    return encode_cursor(datetime.fromisoformat(last["created_at"]), last["id"])
+
+
 def _mock_search_fallback(
     tenant_id: str, function_name: Optional[str], offset: int, limit: int
 ) -> List[Dict[str, Any]]:
@@ -1,14 +1,113 @@
 import logging
 import asyncio
-from typing import List, Dict, Any
-from datetime import datetime
+import uuid
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Dict, List, Mapping
+from datetime import UTC, datetime
+
+import asyncpg
+from sqlalchemy import String, cast, func, lambda_stmt, select, text, tuple_
 from sqlalchemy.exc import SQLAlchemyError
 
-from app.core.database import async_session_maker
+from app.core.database import (
+    async_session_maker,
+    engine,
+    json_serializer,
+    read_engine,
+)
 from app.models.event import Event, ExecutionSummary
 
 logger = logging.getLogger("temporallayr.storage")
 
+# Read statements are built with lambda_stmt: SQLAlchemy analyses each lambda once per
+# call site, caches the resulting statement keyed on which lambdas were appended, and
+# re-extracts only the closure values as bound parameters on later calls. Closures must
+# therefore reference plain values, never branch on them.
+
+# Rows fetched per server-side cursor round trip when streaming event payloads
+_STREAM_CHUNK = 500
+
+# id is generated client-side (the column default is Python's uuid4, not a server default)
+_ALERT_RULE_INSERT_SQL = (
+    "INSERT INTO alert_rules (id, tenant_id, name, failure_type, node_name, webhook_url) "
+    "VALUES ($1, $2, $3, $4, $5, $6) RETURNING id"
+)
+
+# Recent execution ids remembered per tenant; older ones are evicted first
+EXECUTION_CACHE_SIZE = 1024
+
+# Batches at or above this size stream both tables through binary COPY; smaller ones go
+# out as INSERT ... SELECT FROM unnest(...), one array parameter per column
+COPY_THRESHOLD = 100
+_EVENT_COPY_COLUMNS = ["id", "tenant_id", "event_type", "timestamp", "payload"]
+_SUMMARY_COPY_COLUMNS = ["id", "tenant_id", "created_at", "node_count", "node_names"]
+# JSON travels as text[] and is cast per row, independent of the driver's jsonb codec
+_EVENT_UNNEST_SQL = (
+    "INSERT INTO events (id, tenant_id, event_type, timestamp, payload) "
+    "SELECT id, tenant_id, event_type, ts, payload::jsonb "
+    "FROM unnest($1::uuid[], $2::text[], $3::text[], $4::timestamptz[], $5::text[]) "
+    "AS t(id, tenant_id, event_type, ts, payload)"
+)
+# Both tables in one statement: the events insert runs as a data-modifying CTE, so the
+# pair commits atomically as a single implicit transaction in one round trip
+_EVENT_SUMMARY_UNNEST_SQL = (
+    "WITH new_events AS (" + _EVENT_UNNEST_SQL + ") INSERT INTO execution_summaries "
+    "(id, tenant_id, created_at, node_count, node_names) "
+    "SELECT id, tenant_id, created_at, node_count, node_names::jsonb "
+    "FROM unnest($6::text[], $7::text[], $8::timestamptz[], $9::int[], $10::text[]) "
+    "AS t(id, tenant_id, created_at, node_count, node_names)"
+)
+
+
+# Fills node_names for summaries written before the column existed (they hold the '[]'
+# default), one id-ordered slice per statement: each summary takes the names of its
+# latest event carrying a nodes array, matching what ingest stores. Returns the slice's
+# last id, to resume after, and how many rows were updated; summaries without any
+# node names keep '[]' and are simply stepped over.
+_NODE_NAMES_BACKFILL_SQL = text("""
+WITH pending AS (
+    SELECT id, tenant_id FROM execution_summaries
+    WHERE node_names = '[]'::jsonb AND id > :after_id
+    ORDER BY id
+    LIMIT :batch_size
+), latest AS (
+    SELECT DISTINCT ON (p.id, p.tenant_id) p.id, p.tenant_id, e.payload -> 'nodes' AS nodes
+    FROM pending p
+    JOIN events e ON e.tenant_id = p.tenant_id
+        AND (e.payload @> jsonb_build_object('execution_id', p.id)
+             OR e.payload @> jsonb_build_object('id', p.id))
+        AND coalesce(e.payload ->> 'execution_id', e.payload ->> 'id') = p.id
+    WHERE jsonb_typeof(e.payload -> 'nodes') = 'array'
+    ORDER BY p.id, p.tenant_id, e.timestamp DESC
+), names AS (
+    SELECT l.id, l.tenant_id, jsonb_agg(n.name ORDER BY n.pos) AS node_names
+    FROM latest l
+    CROSS JOIN LATERAL (
+        SELECT coalesce(x ->> 'name', x #>> '{}') AS name, min(pos) AS pos
+        FROM jsonb_array_elements(l.nodes) WITH ORDINALITY AS a(x, pos)
+        WHERE jsonb_typeof(x -> 'name') = 'string' OR jsonb_typeof(x) = 'string'
+        GROUP BY 1
+    ) n
+    WHERE n.name <> ''
+    GROUP BY l.id, l.tenant_id
+), updated AS (
+    UPDATE execution_summaries s SET node_names = names.node_names
+    FROM names
+    WHERE s.id = names.id AND s.tenant_id = names.tenant_id
+    RETURNING s.id
+)
+SELECT (SELECT max(id) FROM pending) AS last_id,
+       (SELECT count(*) FROM updated) AS updated
+""")
+
+
+def _node_names(nodes: Any) -> List[str]:
+    """Distinct node names in graph order; nodes may be bare names or dicts with a "name"."""
+    if not isinstance(nodes, list):
+        return []
+    names = (n.get("name") if isinstance(n, dict) else n for n in nodes)
+    return list(dict.fromkeys(n for n in names if isinstance(n, str) and n))
+
 
 class StorageService:
     def __init__(self, max_retries: int = 3, base_delay: float = 1.0):
@@ -16,8 +115,9 @@ class StorageService:
         self.base_delay = base_delay
 
         # In-memory execution cache optimizing multi-tenant file-fallback storage arrays natively
-        # tenant_id -> list of execution IDs sorted by newest first
-        self._execution_cache: Dict[str, List[str]] = {}
+        # tenant_id -> execution IDs in ingest order (newest last), bounded per tenant so
+        # membership and updates stay O(1); newest first is reversed(cache)
+        self._execution_cache: Dict[str, "OrderedDict[str, None]"] = {}
 
         print("[INDEX] ready")
 
@@ -26,7 +126,8 @@ class StorageService:
         Execute high-throughput async DB batch inserts reliably explicitly backing off on transient PostgreSQL faults.
 
         Args:
-            batch: List of dictionaries natively containing dict(tenant_id=str, event=dict)
+            batch: List of dictionaries natively containing dict(tenant_id=str, event=dict),
+                optionally with ingested_at=datetime from enqueue
         """
         if not batch or not async_session_maker:
             logger.warning(
@@ -34,25 +135,41 @@ class StorageService:
             )
             return False
 
-        # Transform raw structured batches mapping natively over target SQLAlchemy model entities tightly
-        event_models = []
+        # Transform raw structured batches straight into driver row tuples in one pass; no
+        # ORM entities, so no descriptor, identity-map or unit-of-work cost per row
+        event_records = []
+        # One summary per execution id (its primary key), the batch's latest event winning
+        summary_records: Dict[str, tuple] = {}
+        # One clock read per batch for every row lacking a usable receipt time
+        batch_now = datetime.now(UTC)
         for item in batch:
             tenant_id = item.get("tenant_id")
             event_data = item.get("event", {})
 
-            # Map robust timestamp fallback extracting inner schemas defensively
-            timestamp_str = event_data.get("_ingested_at")
-            try:
-                dt = (
-                    datetime.fromisoformat(timestamp_str)
-                    if timestamp_str
-                    else datetime.utcnow()
+            # Enqueue hands over the receipt datetime directly; only items built elsewhere
+            # fall back to parsing the payload's ISO string defensively
+            dt = item.get("ingested_at")
+            if dt is None:
+                timestamp_str = event_data.get("_ingested_at")
+                try:
+                    dt = (
+                        datetime.fromisoformat(timestamp_str)
+                        if timestamp_str
+                        else batch_now
+                    )
+                except (TypeError, ValueError):
+                    dt = batch_now
+
+            # Raw writes bypass ORM defaults, so id and event_type are supplied explicitly;
+            # the computed search columns are generated server-side as usual
+            event_records.append(
+                (
+                    uuid.uuid4(),
+                    tenant_id,
+                    "execution_graph",
+                    dt,
+                    json_serializer(event_data),
                 )
-            except ValueError:
-                dt = datetime.utcnow()
-
-            event_models.append(
-                Event(tenant_id=tenant_id, timestamp=dt, payload=event_data)
             )
 
             # Build parallel index record extracting graph topologies gracefully
@@ -60,41 +177,56 @@ class StorageService:
             if exec_id:
                 nodes = event_data.get("nodes", [])
                 node_count = len(nodes) if isinstance(nodes, list) else 1
-                event_models.append(
-                    ExecutionSummary(
-                        id=str(exec_id),
-                        tenant_id=tenant_id,
-                        created_at=dt,
-                        node_count=node_count,
-                    )
+                summary_records[str(exec_id)] = (
+                    str(exec_id),
+                    tenant_id,
+                    dt,
+                    node_count,
+                    json_serializer(_node_names(nodes)),
                 )
 
                 # Push to in-memory cache directly resolving mock fallbacks
-                if tenant_id and exec_id:
-                    if tenant_id not in self._execution_cache:
-                        self._execution_cache[tenant_id] = []
-                    # Keep sorted chronological ordering natively appending newest first
-                    if str(exec_id) not in self._execution_cache[tenant_id]:
-                        self._execution_cache[tenant_id].insert(0, str(exec_id))
+                if tenant_id:
+                    cache = self._execution_cache.get(tenant_id)
+                    if cache is None:
+                        cache = self._execution_cache[tenant_id] = OrderedDict()
+                    # A repeat sighting refreshes the id to newest
+                    cache[str(exec_id)] = None
+                    cache.move_to_end(str(exec_id))
+                    if len(cache) > EXECUTION_CACHE_SIZE:
+                        cache.popitem(last=False)
+
+        write = (
+            self._copy_batch
+            if len(event_records) >= COPY_THRESHOLD
+            else self._insert_batch
+        )
+        summaries = list(summary_records.values())
 
         # Retry transient storage execution loop natively isolating background worker crashes cleanly
         for attempt in range(1, self.max_retries + 1):
             try:
                 async with async_session_maker() as session:  # type: AsyncSession
-                    session.add_all(event_models)
+                    await write(session, event_records, summaries)
                     await session.commit()
                     logger.info(
-                        f"Successfully persisted {len(event_models)} events to PostgreSQL backend."
+                        "Successfully persisted %d events to PostgreSQL backend.",
+                        len(event_records),
                     )
                     return True
-            except SQLAlchemyError as e:
+            except (SQLAlchemyError, asyncpg.PostgresError) as e:
+                # Writes run on the driver connection, so its errors arrive unwrapped
                 logger.error(
-                    f"Database insertion failed (Attempt {attempt}/{self.max_retries}): {e}"
+                    "Database insertion failed (Attempt %d/%d): %s",
+                    attempt,
+                    self.max_retries,
+                    e,
                 )
 
                 if attempt == self.max_retries:
                     logger.critical(
-                        f"Exhausted db retry attempts dropping {len(event_models)} telemetry records."
+                        "Exhausted db retry attempts dropping %d telemetry records.",
+                        len(event_records),
                     )
                     # Prevent worker crash, bubble up handled failure logically
                     return False
@@ -109,6 +241,127 @@ class StorageService:
 
         return False
 
+    @staticmethod
+    async def _driver_connection(session):
+        """The asyncpg connection under the session, for protocol-level bulk writes."""
+        conn = await session.connection()
+        raw = await conn.get_raw_connection()
+        return raw.driver_connection
+
+    async def _insert_batch(
+        self, session, event_records: List[tuple], summary_records: List[tuple]
+    ) -> None:
+        """Insert both tables with one unnest() statement: a single round trip per batch."""
+        driver = await self._driver_connection(session)
+        # The session has issued no statement, so nothing is open on the driver; a lone
+        # statement autocommits, needing no BEGIN/COMMIT exchanges around it
+        if summary_records:
+            await driver.execute(
+                _EVENT_SUMMARY_UNNEST_SQL, *zip(*event_records), *zip(*summary_records)
+            )
+        else:
+            await driver.execute(_EVENT_UNNEST_SQL, *zip(*event_records))
+
+    async def _copy_batch(
+        self, session, event_records: List[tuple], summary_records: List[tuple]
+    ) -> None:
+        """Stream both tables through COPY FROM STDIN in one driver-level transaction."""
+        driver = await self._driver_connection(session)
+        async with driver.transaction():
+            await driver.copy_records_to_table(
+                Event.__tablename__,
+                records=event_records,
+                columns=_EVENT_COPY_COLUMNS,
+            )
+            if summary_records:
+                await driver.copy_records_to_table(
+                    ExecutionSummary.__tablename__,
+                    records=summary_records,
+                    columns=_SUMMARY_COPY_COLUMNS,
+                )
+
+    async def backfill_node_names(self, batch_size: int = 500) -> int:
+        """Fill node_names on summaries stored before ingest recorded it.
+
+        Runs one short transaction per slice of batch_size summaries, so it is safe to
+        run against a live deployment and to rerun; returns how many rows it updated.
+        """
+        if not engine:
+            logger.warning(
+                "Skipping node_names backfill: Uninitialized database engine."
+            )
+            return 0
+
+        after_id, total = "", 0
+        while True:
+            async with engine.begin() as conn:
+                row = (
+                    await conn.execute(
+                        _NODE_NAMES_BACKFILL_SQL,
+                        {"after_id": after_id, "batch_size": batch_size},
+                    )
+                ).one()
+            if row.last_id is None:
+                break
+            after_id, total = row.last_id, total + row.updated
+            logger.info("Backfilled node_names through %s (%d rows)", after_id, total)
+        return total
+
+    @staticmethod
+    def _events_statement(
+        tenant_id: str,
+        limit: int,
+        from_time: datetime | None,
+        to_time: datetime | None,
+    ):
+        # Bound explicit scan parameters natively; each lambda is analysed once per call
+        # site and its closure values become bound parameters (see module note)
+        stmt = lambda_stmt(
+            lambda: select(Event.payload).where(Event.tenant_id == tenant_id)
+        )
+
+        if from_time:
+            stmt += lambda s: s.where(Event.timestamp >= from_time)
+        if to_time:
+            stmt += lambda s: s.where(Event.timestamp <= to_time)
+
+        # Force sort mappings mapping chronological extraction optimally gracefully capping
+        stmt += lambda s: s.order_by(Event.timestamp.desc()).limit(limit)
+        return stmt
+
+    @staticmethod
+    async def _stream_scalars(stmt) -> AsyncIterator[Any]:
+        """Yield a read-only statement's first column through a server-side cursor.
+
+        Rows cross the wire _STREAM_CHUNK at a time, so the driver never buffers the whole
+        result next to the caller's own copy.
+        """
+        # Read-only Core statement: a pooled connection suffices, no AsyncSession
+        async with read_engine.connect() as conn:
+            result = await conn.stream_scalars(
+                stmt.execution_options(yield_per=_STREAM_CHUNK)
+            )
+            async for value in result:
+                yield value
+
+    async def iter_events(
+        self,
+        tenant_id: str,
+        limit: int = 100,
+        from_time: datetime | None = None,
+        to_time: datetime | None = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Yield tenant event payloads newest first without accumulating them.
+
+        For streaming consumers (chunked responses, exports); peak memory stays near one
+        cursor chunk of payloads whatever the limit.
+        """
+        if not read_engine:
+            return
+        stmt = self._events_statement(tenant_id, limit, from_time, to_time)
+        async for payload in self._stream_scalars(stmt):
+            yield payload
+
     async def query_events(
         self,
         tenant_id: str,
@@ -119,28 +372,17 @@ class StorageService:
         """
         Execute highly structured tenant event scans efficiently leveraging composite API key indexes defensively.
         """
-        from sqlalchemy import select
-
-        if not async_session_maker:
+        if not read_engine:
             logger.warning("Skipping event query: Uninitialized database engine.")
             return []
 
-        # Bound explicit scan parameters natively
-        stmt = select(Event.payload).where(Event.tenant_id == tenant_id)
-
-        if from_time:
-            stmt = stmt.where(Event.timestamp >= from_time)
-        if to_time:
-            stmt = stmt.where(Event.timestamp <= to_time)
-
-        # Force sort mappings mapping chronological extraction optimally gracefully capping
-        stmt = stmt.order_by(Event.timestamp.desc()).limit(limit)
-
         try:
-            async with async_session_maker() as session:
-                result = await session.execute(stmt)
-                # Unpack scalar JSONB payload blocks directly cleanly
-                return [row for row in result.scalars()]
+            return [
+                payload
+                async for payload in self.iter_events(
+                    tenant_id, limit, from_time, to_time
+                )
+            ]
         except SQLAlchemyError as e:
             logger.error(f"Failed extracting tenant query payload bounds natively: {e}")
             return []
@@ -157,43 +399,44 @@ class StorageService:
         sort: str = "desc",
     ):
         """Production Query execution mapped organically blocking limits securely mapping complex nested objects."""
-        from sqlalchemy import select
-
-        if not async_session_maker:
+        if not read_engine:
             logger.warning(
                 "Database offline. Returning mocked simulated search arrays safely."
             )
             # Simulated offline boundaries testing logic directly
             return [{"tenant_id": tenant_id, "mock": True}]
 
-        stmt = select(Event.payload).where(Event.tenant_id == tenant_id)
+        stmt = lambda_stmt(
+            lambda: select(Event.payload).where(Event.tenant_id == tenant_id)
+        )
 
         # Apply strict query filters mappings naturally without hardcoding nested fields destructively
         if start_time:
-            stmt = stmt.where(Event.timestamp >= start_time)
+            stmt += lambda s: s.where(Event.timestamp >= start_time)
         if end_time:
-            stmt = stmt.where(Event.timestamp <= end_time)
+            stmt += lambda s: s.where(Event.timestamp <= end_time)
 
-        # Extract dynamic JSON queries matching bounds efficiently
+        # Extract dynamic JSON queries matching bounds efficiently: one @> containment
+        # document so the jsonb_path_ops GIN index (ix_events_payload_gin) serves both keys
+        filter_doc = {}
         if fingerprint:
-            # PostgreSQL JSONB operator '->>' retrieves string organically
-            stmt = stmt.where(Event.payload["fingerprint"].astext == fingerprint)
+            filter_doc["fingerprint"] = fingerprint
         if event_type:
-            stmt = stmt.where(Event.payload["type"].astext == event_type)
+            filter_doc["type"] = event_type
+        if filter_doc:
+            stmt += lambda s: s.where(Event.payload.contains(filter_doc))
 
         # Sorting
         if sort == "asc":
-            stmt = stmt.order_by(Event.timestamp.asc())
+            stmt += lambda s: s.order_by(Event.timestamp.asc())
         else:
-            stmt = stmt.order_by(Event.timestamp.desc())
+            stmt += lambda s: s.order_by(Event.timestamp.desc())
 
-        stmt = stmt.limit(limit).offset(offset)
+        stmt += lambda s: s.limit(limit).offset(offset)
 
         try:
-            async with async_session_maker() as session:
-                result = await session.execute(stmt)
-                # Unpack internal mapping objects
-                return [row for row in result.scalars()]
+            # Unpack internal mapping objects chunk by chunk off a server-side cursor
+            return [payload async for payload in self._stream_scalars(stmt)]
         except SQLAlchemyError as e:
             logger.error(f"Failed extracting tenant query bounds dynamically: {e}")
             return []
@@ -257,8 +500,18 @@ class StorageService:
         if not async_session_maker:
             return []
 
+        # Only listing columns are projected: node_count is the generated column, and
+        # the execution id is extracted in SQL, so no payload crosses the wire
         stmt = (
-            select(Event)
+            select(
+                func.coalesce(
+                    Event.payload["execution_id"].astext,
+                    Event.payload["id"].astext,
+                    cast(Event.id, String),
+                ).label("id"),
+                Event.timestamp,
+                Event.node_count,
+            )
             .where(Event.tenant_id == tenant_id)
             .order_by(Event.timestamp.desc())
             .limit(limit)
@@ -268,24 +521,14 @@ class StorageService:
         try:
             async with async_session_maker() as session:
                 result = await session.execute(stmt)
-                for event in result.scalars():
-                    payload = event.payload or {}
-                    # Attempt to extract id and node count from standard formats
-                    exec_id = (
-                        payload.get("execution_id")
-                        or payload.get("id")
-                        or str(event.id)
-                    )
-                    nodes = payload.get("nodes", [])
-                    node_count = len(nodes) if isinstance(nodes, list) else 1
-
+                for row in result:
                     executions.append(
                         {
-                            "id": exec_id,
-                            "created_at": event.timestamp.isoformat()
-                            if event.timestamp
-                            else "",
-                            "node_count": node_count,
+                            "id": row.id,
+                            "created_at": (
+                                row.timestamp.isoformat() if row.timestamp else ""
+                            ),
+                            "node_count": row.node_count,
                         }
                     )
         except SQLAlchemyError as e:
@@ -296,49 +539,125 @@ class StorageService:
         return executions
 
     async def list_executions(
-        self, tenant_id: str, limit: int = 50, offset: int = 0, sort_desc: bool = True
+        self,
+        tenant_id: str,
+        limit: int = 50,
+        offset: int = 0,
+        sort_desc: bool = True,
+        cursor: str | None = None,
     ) -> Dict[str, Any]:
-        """Paginated retrieval native over indexed lightweight tracker models efficiently."""
-        from sqlalchemy import select, func
+        """Paginated retrieval native over indexed lightweight tracker models efficiently.
 
-        if not async_session_maker:
+        ``cursor`` (the previous page's ``next_cursor``) seeks past a (created_at, id)
+        boundary; ``offset`` is kept for older clients but rescans every skipped row.
+        """
+        from app.query.engine import decode_cursor, encode_cursor
+
+        if not read_engine:
             return {"executions": [], "total": 0}
 
-        try:
-            async with async_session_maker() as session:
-                # 1. Count total metric quickly against indexes
-                count_stmt = select(func.count(ExecutionSummary.id)).where(
-                    ExecutionSummary.tenant_id == tenant_id
-                )
-                total = await session.scalar(count_stmt) or 0
+        boundary = decode_cursor(cursor, id_type=str) if cursor else None
 
-                # 2. Extract paginated slice gracefully
-                stmt = select(ExecutionSummary).where(
-                    ExecutionSummary.tenant_id == tenant_id
+        # 1. Count total metric quickly against indexes (keyset pages and past-the-end
+        # offsets only; see below)
+        count_stmt = lambda_stmt(
+            lambda: select(func.count(ExecutionSummary.id)).where(
+                ExecutionSummary.tenant_id == tenant_id
+            )
+        )
+
+        # 2. Extract paginated slice gracefully, projecting only response columns. Offset
+        # pages see every tenant row before the window, so count(*) OVER () carries the
+        # total in the same scan; after a keyset WHERE it would count only the tail
+        if boundary is None:
+            stmt = lambda_stmt(
+                lambda: select(
+                    ExecutionSummary.id,
+                    ExecutionSummary.tenant_id,
+                    ExecutionSummary.created_at,
+                    ExecutionSummary.node_count,
+                    func.count().over().label("total"),
+                ).where(ExecutionSummary.tenant_id == tenant_id)
+            )
+        else:
+            stmt = lambda_stmt(
+                lambda: select(
+                    ExecutionSummary.id,
+                    ExecutionSummary.tenant_id,
+                    ExecutionSummary.created_at,
+                    ExecutionSummary.node_count,
+                ).where(ExecutionSummary.tenant_id == tenant_id)
+            )
+
+        # id tie-breaker keeps page boundaries stable and matches ix_execs_tenant_created
+        if sort_desc:
+            stmt += lambda s: s.order_by(
+                ExecutionSummary.created_at.desc(), ExecutionSummary.id.desc()
+            )
+        else:
+            stmt += lambda s: s.order_by(
+                ExecutionSummary.created_at.asc(), ExecutionSummary.id.asc()
+            )
+
+        if boundary is None:
+            stmt += lambda s: s.offset(offset)
+        else:
+            after_ts, after_id = boundary
+            if sort_desc:
+                stmt += lambda s: s.where(
+                    tuple_(ExecutionSummary.created_at, ExecutionSummary.id)
+                    < tuple_(after_ts, after_id)
+                )
+            else:
+                stmt += lambda s: s.where(
+                    tuple_(ExecutionSummary.created_at, ExecutionSummary.id)
+                    > tuple_(after_ts, after_id)
                 )
 
-                if sort_desc:
-                    stmt = stmt.order_by(ExecutionSummary.created_at.desc())
-                else:
-                    stmt = stmt.order_by(ExecutionSummary.created_at.asc())
+        stmt += lambda s: s.limit(limit)
 
-                stmt = stmt.limit(limit).offset(offset)
-                result = await session.execute(stmt)
+        async def _count() -> int:
+            async with read_engine.connect() as conn:
+                return await conn.scalar(count_stmt) or 0
 
-                executions = []
-                for summary in result.scalars():
-                    executions.append(
-                        {
-                            "id": summary.id,
-                            "tenant_id": summary.tenant_id,
-                            "created_at": summary.created_at.isoformat()
-                            if summary.created_at
-                            else "",
-                            "node_count": summary.node_count,
-                        }
-                    )
+        async def _page() -> List[Any]:
+            async with read_engine.connect() as conn:
+                return (await conn.execute(stmt)).all()
 
-                return {"executions": executions, "total": total}
+        try:
+            if boundary is None:
+                rows = await _page()
+                # An empty page past the end has no row to carry the window total
+                if rows:
+                    total = rows[0].total
+                else:
+                    total = await _count() if offset else 0
+            else:
+                # Each query checks out its own pooled connection, so both run
+                # concurrently; one connection cannot interleave two statements
+                total, rows = await asyncio.gather(_count(), _page())
+
+            # Native values only: the response encoder renders datetimes itself
+            executions = [
+                {
+                    "id": row.id,
+                    "tenant_id": row.tenant_id,
+                    "created_at": row.created_at,
+                    "node_count": row.node_count,
+                }
+                for row in rows
+            ]
+
+            # A full page may have a successor; a short one is the last
+            next_cursor = None
+            if rows and len(rows) >= limit:
+                next_cursor = encode_cursor(rows[-1].created_at, rows[-1].id)
+
+            return {
+                "executions": executions,
+                "total": total,
+                "next_cursor": next_cursor,
+            }
 
         except SQLAlchemyError as e:
             logger.error(f"Failed extracting indexed executions pagination: {e}")
@@ -350,39 +669,53 @@ class StorageService:
         return {"executions": [], "total": 0}
 
     async def list_incidents(
-        self, tenant_id: str, limit: int = 50, offset: int = 0
-    ) -> List[Dict[str, Any]]:
-        """Fetch strictly isolated incidents sorted newest first natively."""
-        from sqlalchemy import select
+        self,
+        tenant_id: str,
+        limit: int = 50,
+        offset: int = 0,
+        cursor: str | None = None,
+    ) -> List[Mapping[str, Any]]:
+        """Fetch strictly isolated incidents sorted newest first natively.
+
+        ``cursor`` seeks past a (timestamp, id) boundary as list_executions does; the
+        last row of a full page is that boundary (see incidents_next_cursor).
+        """
         from app.models.event import Incident
+        from app.query.engine import decode_cursor
 
-        if not async_session_maker:
+        if not read_engine:
             return []
 
+        stmt = lambda_stmt(
+            lambda: select(
+                Incident.id,
+                Incident.tenant_id,
+                Incident.execution_id,
+                Incident.timestamp,
+                Incident.failure_type,
+                Incident.node_name,
+                Incident.summary,
+            )
+            .where(Incident.tenant_id == tenant_id)
+            # id tie-breaker keeps page boundaries stable and matches ix_incidents_tenant_time
+            .order_by(Incident.timestamp.desc(), Incident.id.desc())
+            .limit(limit)
+        )
+        boundary = decode_cursor(cursor) if cursor else None
+        if boundary is None:
+            stmt += lambda s: s.offset(offset)
+        else:
+            after_ts, after_id = boundary
+            stmt += lambda s: s.where(
+                tuple_(Incident.timestamp, Incident.id) < tuple_(after_ts, after_id)
+            )
+
         try:
-            async with async_session_maker() as session:
-                stmt = (
-                    select(Incident)
-                    .where(Incident.tenant_id == tenant_id)
-                    .order_by(Incident.timestamp.desc())
-                    .limit(limit)
-                    .offset(offset)
-                )
-                result = await session.execute(stmt)
-                incidents = result.scalars().all()
+            async with read_engine.connect() as conn:
+                result = await conn.execute(stmt)
 
-                return [
-                    {
-                        "id": str(inc.id),
-                        "tenant_id": inc.tenant_id,
-                        "execution_id": inc.execution_id,
-                        "timestamp": inc.timestamp,
-                        "failure_type": inc.failure_type,
-                        "node_name": inc.node_name,
-                        "summary": inc.summary,
-                    }
-                    for inc in incidents
-                ]
+                # Read-only row mappings, as in list_executions
+                return result.mappings().all()
         except SQLAlchemyError as e:
             logger.error(f"Failed extracting incidents natively: {e}")
         except Exception as e:
@@ -390,6 +723,18 @@ class StorageService:
 
         return []
 
+    @staticmethod
+    def incidents_next_cursor(
+        incidents: List[Mapping[str, Any]], limit: int
+    ) -> str | None:
+        """Cursor for the page after a list_incidents result; None once a page comes back short."""
+        from app.query.engine import encode_cursor
+
+        if not incidents or len(incidents) < limit:
+            return None
+        last = incidents[-1]
+        return encode_cursor(last["timestamp"], last["id"])
+
     async def create_alert_rule(
         self,
         tenant_id: str,
@@ -397,50 +742,64 @@ class StorageService:
         failure_type: str,
         node_name: str | None,
         webhook_url: str | None,
-    ) -> bool:
-        """Bind structured telemetry notification parameters storing alerts cleanly."""
-        from app.models.event import AlertRule
+    ) -> str | None:
+        """Bind structured telemetry notification parameters storing alerts cleanly.
+
+        Returns the new rule id, or None when the write failed.
+        """
+        rule_id = uuid.uuid4()
 
         if not async_session_maker:
             logger.warning(
                 "Database disconnected. Simulating successful alert rule creation offline natively."
             )
-            return True
+            return str(rule_id)
 
         try:
             async with async_session_maker() as session:
-                new_rule = AlertRule(
-                    tenant_id=tenant_id,
-                    name=name,
-                    failure_type=failure_type,
-                    node_name=node_name,
-                    webhook_url=webhook_url,
+                driver = await self._driver_connection(session)
+                # One autocommitted statement: no ORM flush, no separate BEGIN/COMMIT trips
+                rule_id = await driver.fetchval(
+                    _ALERT_RULE_INSERT_SQL,
+                    rule_id,
+                    tenant_id,
+                    name,
+                    failure_type,
+                    node_name,
+                    webhook_url,
                 )
-                session.add(new_rule)
-                await session.commit()
-                return True
-        except SQLAlchemyError as e:
+                return str(rule_id)
+        except (SQLAlchemyError, asyncpg.PostgresError) as e:
             logger.error(
                 f"Failed storing alert rule structurally mapped to Postgres natively: {e}"
             )
-            return False
+            return None
         except Exception as e:
             logger.error(f"Unexpected error binding alert rules cleanly: {e}")
-            return False
+            return None
 
     async def get_alert_rules_for_tenant(self, tenant_id: str):
         """Extract all active alert configurations organically isolating rules natively."""
         from sqlalchemy import select
         from app.models.event import AlertRule
 
-        if not async_session_maker:
+        if not engine:
             return []
 
         try:
-            async with async_session_maker() as session:
-                stmt = select(AlertRule).where(AlertRule.tenant_id == tenant_id)
-                result = await session.execute(stmt)
-                return result.scalars().all()
+            # Primary, not the replica: a rule created a moment ago must already match.
+            # Rows expose the same attributes the alert index reads from the model.
+            async with engine.connect() as conn:
+                stmt = select(
+                    AlertRule.id,
+                    AlertRule.tenant_id,
+                    AlertRule.name,
+                    AlertRule.failure_type,
+                    AlertRule.node_name,
+                    AlertRule.webhook_url,
+                ).where(AlertRule.tenant_id == tenant_id)
+                result = await conn.execute(stmt)
+                return result.all()
         except SQLAlchemyError as e:
             logger.error(f"Failed extracting tenant alert rules organically: {e}")
         except Exception as e:
@@ -564,28 +923,32 @@ class StorageService:
                 ],
             }
 
-        if not async_session_maker:
+        if not read_engine:
             return None
 
-        # Optimization: filter query by looking at JSONB directly if possible, or scan bounds
+        from sqlalchemy import or_
+
+        # Resolve the id in Postgres: both @> probes are answered by the jsonb_path_ops GIN
+        # index (ix_events_payload_gin), and a UUID-shaped id may also name the event row
+        matches = [
+            Event.payload.contains({"execution_id": execution_id}),
+            Event.payload.contains({"id": execution_id}),
+        ]
+        try:
+            matches.append(Event.id == uuid.UUID(execution_id))
+        except ValueError:
+            pass
+
         stmt = (
-            select(Event)
+            select(Event.payload)
             .where(Event.tenant_id == tenant_id)
+            .where(or_(*matches))
             .order_by(Event.timestamp.desc())
-            .limit(100)
+            .limit(1)
         )
         try:
-            async with async_session_maker() as session:
-                result = await session.execute(stmt)
-                for event in result.scalars():
-                    payload = event.payload or {}
-                    exec_id = (
-                        payload.get("execution_id")
-                        or payload.get("id")
-                        or str(event.id)
-                    )
-                    if exec_id == execution_id:
-                        return payload
+            async with read_engine.connect() as conn:
+                return await conn.scalar(stmt)
         except SQLAlchemyError as e:
             logger.error(f"Failed extracting single execution: {e}")
         except Exception as e:
@@ -3,6 +3,8 @@ import logging
 from typing import Dict, List, Any
 from fastapi import WebSocket
 
+from app.core.event_stream import dumps_frame
+
 logger = logging.getLogger("temporallayr.stream.manager")
 
 
@@ -87,12 +89,34 @@ class StreamManager:
         if broadcast_count > 0:
             logger.info(f"[STREAM] event broadcast count={broadcast_count}")
 
+    async def broadcast_events(
+        self, tenant_id: str, event_type: str, events: List[Dict[str, Any]]
+    ):
+        """Publish several same-type events to a tenant as one WebSocket frame.
+
+        A lone event is sent unchanged. Two or more travel as a distinct
+        "<type>_batch" frame, {"type", "timestamps": [...], "payloads": [...]}, so every
+        frame type keeps a single shape while each client queue slot and send() carries
+        the whole group.
+        """
+        if not events or tenant_id not in self._clients:
+            return
+        if len(events) == 1:
+            frame = events[0]
+        else:
+            frame = {
+                "type": f"{event_type}_batch",
+                "timestamps": [e.get("timestamp") for e in events],
+                "payloads": [e.get("payload") for e in events],
+            }
+        await self.broadcast_event(tenant_id, frame)
+
     async def _sender_loop(self, websocket: WebSocket, queue: asyncio.Queue):
         """Dynamically isolate delivery resolving I/O blocking gracefully natively."""
         try:
             while True:
                 event = await queue.get()
-                await websocket.send_json(event)
+                await websocket.send_text(dumps_frame(event))
         except asyncio.CancelledError:
             pass
         except Exception as e:
@@ -0,0 +1,20 @@
+import asyncio
+import argparse
+import logging
+
+from app.services.storage_service import StorageService
+
+
+async def backfill(batch_size):
+    updated = await StorageService().backfill_node_names(batch_size=batch_size)
+    print(f"Backfilled node_names on {updated} execution summaries.")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(
+        description="Fill execution_summaries.node_names for rows stored before it existed."
+    )
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+    asyncio.run(backfill(args.batch_size))
@@ -53,4 +53,12 @@ if __name__ == "__main__":
             }
 
     print(f"Invoking uvicorn on 0.0.0.0:{port}")
-    uvicorn.run(app, host="0.0.0.0", port=port, log_level="info", access_log=True)
+    # loop="auto" picks uvloop when installed (Linux/macOS) and falls back to asyncio
+    uvicorn.run(
+        app,
+        host="0.0.0.0",
+        port=port,
+        log_level="info",
+        access_log=True,
+        loop="auto",
+    )
@@ -92,7 +92,7 @@ class TestDashboardRuntime(unittest.IsolatedAsyncioTestCase):
     @patch("app.query.runtime.execute_saved_query")
     async def test_execute_dashboard_concurrently_with_failures(self, mock_execute):
         # We'll mock the internal execute_saved_query block so it dynamically mimics structural failures perfectly
-        async def mock_execute_function(saved_query_id, tenant_id):
+        async def mock_execute_function(saved_query_id, tenant_id, query_json=None):
             if saved_query_id == "sq-1":
                 return [{"data": "success-1"}]
             if saved_query_id == "sq-2":
@@ -128,11 +128,29 @@ class TestDashboardRuntime(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(p4["data"], [])
         self.assertTrue("timed out after 10s" in p4["error"])
 
+    async def test_panel_timeout_covers_wait_for_concurrency_slot(self):
+        import app.query.runtime as runtime
+
+        # Every slot held by other dashboards' panels for longer than the panel budget
+        saturated = asyncio.Semaphore(1)
+        await saturated.acquire()
+        panel = {"panel_id": "p-1", "name": "Panel 1", "saved_query": {"id": "sq-1"}}
+
+        with patch.object(runtime, "_PANEL_CONCURRENCY", saturated), patch.object(
+            runtime, "PANEL_TIMEOUT_SECONDS", 0.05
+        ):
+            res = await asyncio.wait_for(
+                runtime._run_panel_safe(panel, "tenant-1"), timeout=1.0
+            )
+
+        self.assertEqual(res["data"], [])
+        self.assertTrue("timed out" in res["error"])
+
     def test_run_dashboard_http_endpoint(self):
         # Full integration bounding fast native requests securely via TestClient
         with patch("app.query.runtime.execute_saved_query") as mock_execute:
 
-            async def mock_execute_function(saved_query_id, tenant_id):
+            async def mock_execute_function(saved_query_id, tenant_id, query_json=None):
                 return [{"data": "simulated_http_pass"}]
 
             mock_execute.side_effect = mock_execute_function
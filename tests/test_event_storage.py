@@ -0,0 +1,174 @@
+import asyncio
+import unittest
+import uuid
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.schema import CreateTable
+from sqlalchemy.dialects import postgresql
+
+from app.models.event import TSV_SOURCE_CHARS, Event, ExecutionSummary
+
+# Distinct words whose full tsvector is several MB, far past Postgres' 1MB limit
+OVERSIZED_PROMPT = " ".join(f"token{i}" for i in range(200_000))
+
+
+async def _database_reachable() -> bool:
+    from app.core.database import engine
+
+    if engine is None:
+        return False
+    try:
+        async with engine.connect():
+            return True
+    except Exception:
+        return False
+
+
+class TestPayloadTsvBound(unittest.TestCase):
+    def test_tsvector_source_is_truncated(self):
+        ddl = str(CreateTable(Event.__table__).compile(dialect=postgresql.dialect()))
+        self.assertIn(
+            f"to_tsvector('simple', left(payload::text, {TSV_SOURCE_CHARS}))", ddl
+        )
+        # The worst case stays below the cap (see TSV_SOURCE_CHARS)
+        self.assertLess(TSV_SOURCE_CHARS * 9, 1024 * 1024)
+
+
+class TestOversizedPayloadInsert(unittest.TestCase):
+    """Runs against the configured Postgres; skipped when none is reachable."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.loop = asyncio.new_event_loop()
+        if not cls.loop.run_until_complete(_database_reachable()):
+            cls.loop.close()
+            raise unittest.SkipTest("Postgres not reachable")
+
+        from app.core.database import engine
+
+        async def _create():
+            async with engine.begin() as conn:
+                await conn.run_sync(
+                    Event.metadata.create_all,
+                    tables=[Event.__table__, ExecutionSummary.__table__],
+                )
+
+        cls.loop.run_until_complete(_create())
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.loop.close()
+
+    def setUp(self):
+        self.tenant_id = f"test-oversized-{uuid.uuid4()}"
+
+    def tearDown(self):
+        from app.core.database import engine
+
+        async def _cleanup():
+            async with engine.begin() as conn:
+                await conn.execute(
+                    delete(Event).where(Event.tenant_id == self.tenant_id)
+                )
+                await conn.execute(
+                    delete(ExecutionSummary).where(
+                        ExecutionSummary.tenant_id == self.tenant_id
+                    )
+                )
+
+        self.loop.run_until_complete(_cleanup())
+
+    def _insert_and_count(self, batch):
+        from app.core.database import engine
+        from app.services.storage_service import StorageService
+
+        async def _run():
+            ok = await StorageService().bulk_insert_events(batch)
+            async with engine.connect() as conn:
+                count = await conn.scalar(
+                    select(func.count())
+                    .select_from(Event)
+                    .where(Event.tenant_id == self.tenant_id)
+                )
+            return ok, count
+
+        return self.loop.run_until_complete(_run())
+
+    def test_oversized_payload_is_written(self):
+        event = {"id": f"exec-{uuid.uuid4()}", "prompt": OVERSIZED_PROMPT}
+        ok, count = self._insert_and_count(
+            [{"tenant_id": self.tenant_id, "event": event}]
+        )
+        self.assertTrue(ok)
+        self.assertEqual(count, 1)
+
+    def test_oversized_payload_does_not_block_batch(self):
+        # Enough rows to take the COPY path, one of them oversized
+        batch = [
+            {"tenant_id": self.tenant_id, "event": {"id": f"exec-{i}", "nodes": []}}
+            for i in range(150)
+        ]
+        batch[75]["event"]["prompt"] = OVERSIZED_PROMPT
+        ok, count = self._insert_and_count(batch)
+        self.assertTrue(ok)
+        self.assertEqual(count, len(batch))
+
+
+class _FakeBackfillConnection:
+    def __init__(self, pages, calls):
+        self._pages = pages
+        self._calls = calls
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, stmt, params):
+        self._calls.append(dict(params))
+        page = self._pages.pop(0)
+        return SimpleNamespace(one=lambda: SimpleNamespace(**page))
+
+
+class _FakeBackfillEngine:
+    def __init__(self, pages):
+        self.pages = list(pages)
+        self.calls = []
+
+    def begin(self):
+        return _FakeBackfillConnection(self.pages, self.calls)
+
+
+class TestBackfillNodeNames(unittest.IsolatedAsyncioTestCase):
+    async def test_walks_slices_until_none_remain(self):
+        from app.services import storage_service
+        from app.services.storage_service import StorageService
+
+        fake = _FakeBackfillEngine(
+            [
+                {"last_id": "exec-2", "updated": 2},
+                {"last_id": "exec-4", "updated": 1},
+                {"last_id": None, "updated": 0},
+            ]
+        )
+        with patch.object(storage_service, "engine", fake):
+            updated = await StorageService().backfill_node_names(batch_size=2)
+
+        self.assertEqual(updated, 3)
+        # Each slice resumes after the previous one's last id
+        self.assertEqual([c["after_id"] for c in fake.calls], ["", "exec-2", "exec-4"])
+        self.assertTrue(all(c["batch_size"] == 2 for c in fake.calls))
+
+    def test_statement_only_touches_default_rows(self):
+        from app.services.storage_service import _NODE_NAMES_BACKFILL_SQL
+
+        sql = " ".join(_NODE_NAMES_BACKFILL_SQL.text.split())
+        self.assertIn("WHERE node_names = '[]'::jsonb AND id > :after_id", sql)
+        self.assertIn("LIMIT :batch_size", sql)
+
+
+if __name__ == "__main__":
+    unittest.main()
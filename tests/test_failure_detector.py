@@ -0,0 +1,76 @@
+import unittest
+
+from app.services.failure_detector import (
+    detect_execution_failure,
+    detect_execution_failure_sync,
+    has_graph_nodes,
+    looks_like_error,
+)
+
+
+class TestFailureSignatureWalk(unittest.TestCase):
+    def test_string_leaves_match_case_insensitively(self):
+        self.assertTrue(looks_like_error({"details": "Raised ValueError"}))
+        self.assertTrue(looks_like_error({"logs": ["ok", "Traceback (most recent)"]}))
+        self.assertTrue(looks_like_error({"nested": {"msg": "unhandled EXCEPTION"}}))
+
+    def test_signature_keys_require_truthy_values(self):
+        self.assertTrue(looks_like_error({"exception": "ZeroDivisionError"}))
+        self.assertTrue(looks_like_error({"error": True}))
+        self.assertFalse(looks_like_error({"error_count": 0}))
+        self.assertFalse(looks_like_error({"error": None, "status": "ok"}))
+
+    def test_non_string_scalars_are_ignored(self):
+        self.assertFalse(looks_like_error({"latency": 12.5, "retries": 3}))
+        self.assertFalse(looks_like_error(None))
+
+
+class TestDetectExecutionFailure(unittest.IsolatedAsyncioTestCase):
+    async def test_counter_keys_do_not_trigger_incidents(self):
+        execution = {
+            "tenant_id": "tenant-A",
+            "execution_id": "exec-1",
+            "nodes": [{"name": "Step1", "metadata": {"error_count": 0}}],
+        }
+        self.assertIsNone(await detect_execution_failure(execution))
+
+    async def test_error_metadata_reports_node(self):
+        execution = {
+            "tenant_id": "tenant-B",
+            "id": "exec-2",
+            "graph": {
+                "nodes": [
+                    {"name": "ok", "metadata": {"status": "ok"}},
+                    {"name": "FailingStep", "metadata": {"stderr": "Traceback ..."}},
+                ]
+            },
+        }
+        res = await detect_execution_failure(execution)
+        self.assertIsNotNone(res)
+        self.assertEqual(res["execution_id"], "exec-2")
+        self.assertEqual(res["node_name"], "FailingStep")
+
+
+class TestDetectExecutionFailureSync(unittest.TestCase):
+    def test_falls_back_to_supplied_tenant(self):
+        execution = {
+            "execution_id": "exec-3",
+            "nodes": [{"name": "Step", "metadata": {"error": "boom"}}],
+        }
+        res = detect_execution_failure_sync(execution, "tenant-C")
+        self.assertEqual(res["tenant_id"], "tenant-C")
+        # Payload tenant wins over the fallback
+        execution["tenant_id"] = "tenant-D"
+        res = detect_execution_failure_sync(execution, "tenant-C")
+        self.assertEqual(res["tenant_id"], "tenant-D")
+
+    def test_node_free_payloads_are_prefiltered(self):
+        self.assertFalse(has_graph_nodes({"level": "info", "error": "boom"}))
+        self.assertFalse(has_graph_nodes({"graph": {"nodes": []}, "nodes": [{}]}))
+        self.assertFalse(has_graph_nodes(None))
+        self.assertTrue(has_graph_nodes({"graph": {"nodes": [{"name": "A"}]}}))
+        self.assertTrue(has_graph_nodes({"nodes": ["A"]}))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+import unittest
+from unittest.mock import AsyncMock, patch
+
+from app.services import ingestion_service
+from app.services.ingestion_service import IngestionService
+
+
+class _RecordingStreamManager:
+    def __init__(self):
+        self.calls = []
+
+    async def broadcast_events(self, tenant_id, event_type, events):
+        self.calls.append((tenant_id, event_type, events))
+
+
+class _AcceptingStorage:
+    async def bulk_insert_events(self, batch):
+        return True
+
+
+class TestBatchBroadcastOrder(unittest.IsolatedAsyncioTestCase):
+    async def test_graph_frame_precedes_its_incident_and_keeps_latest_event(self):
+        first = {"execution_id": "exec-1", "nodes": [{"name": "a"}], "rev": 1}
+        latest = {"execution_id": "exec-1", "nodes": [{"name": "a"}], "rev": 2}
+        batch = [
+            {"tenant_id": "tenant-1", "event": first},
+            {"tenant_id": "tenant-1", "event": latest},
+        ]
+        incident = {
+            "timestamp": "2026-02-23T10:00:00Z",
+            "failure_type": "exception",
+            "node_name": "a",
+        }
+
+        def detect(event, tenant_id):
+            return incident if event.get("rev") == 1 else None
+
+        service = IngestionService()
+        service._storage = _AcceptingStorage()
+        manager = _RecordingStreamManager()
+
+        with patch.object(
+            ingestion_service, "stream_manager_v2", manager
+        ), patch.object(
+            ingestion_service, "detect_execution_failure_sync", side_effect=detect
+        ), patch.object(
+            ingestion_service.rule_store, "tenants_with_rules", frozenset()
+        ), patch.object(
+            service, "_persist_incidents", new=AsyncMock()
+        ):
+            self.assertTrue(await service._write_batch(batch))
+
+        self.assertEqual(
+            [event_type for _, event_type, _ in manager.calls],
+            ["execution_graph", "incident_created"],
+        )
+        graph_events = manager.calls[0][2]
+        self.assertEqual(len(graph_events), 1)
+        self.assertEqual(graph_events[0]["payload"]["rev"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+import asyncio
+import unittest
+from unittest.mock import patch
+
+from app.services import ingestion_service
+from app.services.ingestion_service import (
+    INSERT_TIMEOUT_BASE,
+    INSERT_TIMEOUT_PER_EVENT,
+    RULE_TIMEOUT_MAX,
+    IngestionService,
+)
+
+
+class _StalledStorage:
+    async def bulk_insert_events(self, batch):
+        await asyncio.Event().wait()
+
+
+class _AcceptingStorage:
+    async def bulk_insert_events(self, batch):
+        return True
+
+
+class _SilentStreamManager:
+    async def broadcast_events(self, tenant_id, event_type, events):
+        pass
+
+
+class _StalledRuleEngine:
+    async def evaluate_events(self, payloads):
+        await asyncio.Event().wait()
+
+
+class TestInsertTimeout(unittest.IsolatedAsyncioTestCase):
+    async def test_insert_deadline_scales_with_batch_size(self):
+        batch = [
+            {"tenant_id": "tenant-1", "event": {"id": f"exec-{i}"}} for i in range(3000)
+        ]
+        service = IngestionService()
+        service._storage = _StalledStorage()
+        deadlines = []
+        real_wait_for = asyncio.wait_for
+
+        async def recording_wait_for(awaitable, timeout):
+            deadlines.append(timeout)
+            # Expire immediately instead of waiting out the real budget
+            return await real_wait_for(awaitable, 0)
+
+        with patch.object(ingestion_service.asyncio, "wait_for", recording_wait_for):
+            self.assertFalse(await service._write_batch(batch))
+
+        self.assertEqual(
+            deadlines, [INSERT_TIMEOUT_BASE + INSERT_TIMEOUT_PER_EVENT * len(batch)]
+        )
+
+    def test_default_batch_stays_moderate(self):
+        self.assertEqual(IngestionService().max_batch_size, 1000)
+
+
+class TestRuleTimeout(unittest.IsolatedAsyncioTestCase):
+    async def test_rule_deadline_is_capped_and_skips_are_logged(self):
+        batch = [
+            {
+                "tenant_id": "tenant-1" if i % 2 else "tenant-2",
+                "event": {"id": f"e-{i}"},
+            }
+            for i in range(1000)
+        ]
+        service = IngestionService()
+        service._storage = _AcceptingStorage()
+        deadlines = []
+        real_wait_for = asyncio.wait_for
+
+        async def recording_wait_for(awaitable, timeout):
+            deadlines.append(timeout)
+            return await real_wait_for(awaitable, 0 if len(deadlines) > 1 else timeout)
+
+        with patch.object(
+            ingestion_service.asyncio, "wait_for", recording_wait_for
+        ), patch.object(
+            ingestion_service, "rule_engine", _StalledRuleEngine()
+        ), patch.object(
+            ingestion_service.rule_store, "tenants_with_rules", frozenset({"tenant-1"})
+        ), patch.object(
+            ingestion_service, "stream_manager_v2", _SilentStreamManager()
+        ), self.assertLogs(
+            "temporallayr.ingestion", level="ERROR"
+        ) as logs:
+            self.assertTrue(await service._write_batch(batch))
+
+        # Uncapped, 1000 events would have allowed 50s
+        self.assertEqual(deadlines[1], RULE_TIMEOUT_MAX)
+        self.assertIn("skipped rules for 500 events", "\n".join(logs.output))
+
+
+if __name__ == "__main__":
+    unittest.main()
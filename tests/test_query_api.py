@@ -1,11 +1,16 @@
 import unittest
 import asyncio
 from datetime import datetime, UTC, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+from fastapi import Response
 from fastapi.testclient import TestClient
 
 from app.main import app
 from app.services.storage_service import StorageService
-from app.api.query import get_storage_service
+from app.api.query import get_storage_service, search_executions
+from app.models.query import SearchRequest
 
 
 GLOBAL_MOCK_DB = []
@@ -99,3 +104,47 @@ class TestQueryAPI(unittest.TestCase):
         )
         self.assertEqual(res.status_code, 400)
         self.assertEqual(res.json()["detail"], "Limit cannot exceed 1000")
+
+
+class TestSearchRoute(unittest.IsolatedAsyncioTestCase):
+    def _request(self):
+        return SimpleNamespace(
+            app=SimpleNamespace(state=SimpleNamespace(db_status="connected"))
+        )
+
+    async def test_search_pages_summaries_by_cursor(self):
+        page = [
+            {
+                "id": f"exec-{i}",
+                "created_at": f"2026-02-2{i}T10:00:00+00:00",
+                "node_count": 1,
+            }
+            for i in (3, 2)
+        ]
+        summaries = AsyncMock(return_value=page)
+        with patch("app.services.search.search_executions", summaries):
+            body = await search_executions(
+                self._request(),
+                Response(),
+                SearchRequest(function_name="fake_llm_call", limit=2, cursor="abc"),
+                api_key="dev-test-key",
+            )
+
+        kwargs = summaries.await_args.kwargs
+        self.assertEqual(kwargs["tenant_id"], "dev-test-key")
+        self.assertEqual(kwargs["function_name"], "fake_llm_call")
+        self.assertEqual(kwargs["cursor"], "abc")
+        self.assertEqual(body["results"], page)
+        # A full page hands back the cursor for the next one
+        self.assertIsNotNone(body["next_cursor"])
+
+    async def test_short_page_has_no_next_cursor(self):
+        summaries = AsyncMock(return_value=[])
+        with patch("app.services.search.search_executions", summaries):
+            body = await search_executions(
+                self._request(),
+                Response(),
+                SearchRequest(limit=5),
+                api_key="dev-test-key",
+            )
+        self.assertEqual(body, {"results": [], "next_cursor": None})
@@ -3,7 +3,6 @@ import asyncio
 from fastapi.testclient import TestClient
 
 from app.main import app
-from app.models.event import Event
 
 
 class TestQueryEngine(unittest.TestCase):
@@ -20,29 +19,15 @@ class TestQueryEngine(unittest.TestCase):
     def test_query_engine_node_search(self):
         """Simulate ingesting traces efficiently scaling DB bounds organically."""
         from unittest.mock import patch
-        import datetime
-        import uuid
 
         mock_execute = patch(
             "app.query.engine.QueryEngine._execute_with_safeguards"
         ).start()
 
-        mock_event = Event(
-            id=uuid.uuid4(),
-            tenant_id=self.tenant_id,
-            timestamp=datetime.datetime.utcnow(),
-            payload={
-                "execution_id": "exec-123",
-                "graph": {
-                    "nodes": [
-                        {"name": "fake_llm_call", "output": 20},
-                        {"name": "other_node", "output": 10},
-                    ]
-                },
-            },
-        )
-
-        mock_execute.return_value = ([mock_event], False)
+        # The lateral jsonb_array_elements join hands back matching node objects directly
+        mock_node = {"name": "fake_llm_call", "output": 20}
+
+        mock_execute.return_value = ([mock_node], False)
 
         # Query matching exact node
         payload = {"filters": {"node_name": "fake_llm_call"}}
@@ -62,3 +47,41 @@ class TestQueryEngine(unittest.TestCase):
         self.assertFalse(data.get("partial"))
 
         patch.stopall()
+
+
+class TestKeysetCursor(unittest.TestCase):
+    def test_round_trips_uuid_and_text_ids(self):
+        import uuid
+        from datetime import datetime, timezone
+        from app.query.engine import decode_cursor, encode_cursor
+
+        ts = datetime(2026, 2, 22, 12, 0, tzinfo=timezone.utc)
+        row_id = uuid.uuid4()
+        self.assertEqual(decode_cursor(encode_cursor(ts, row_id)), (ts, row_id))
+        # Execution summaries are keyed by free-form text ids, "|" included
+        cursor = encode_cursor(ts, "exec|42")
+        self.assertEqual(decode_cursor(cursor, id_type=str), (ts, "exec|42"))
+        self.assertIsNone(decode_cursor(cursor))
+
+
+class TestSearchTextRouting(unittest.TestCase):
+    def _compile(self, search_text):
+        from sqlalchemy import select
+        from sqlalchemy.dialects import postgresql
+        from app.models.event import Event
+        from app.query.engine import _apply_event_filters
+        from app.query.models import MultiResourceQueryRequest
+
+        query = MultiResourceQueryRequest(tenant_id="t", search_text=search_text)
+        stmt = _apply_event_filters(select(Event.id), query)
+        return stmt.compile(dialect=postgresql.dialect())
+
+    def test_partial_trailing_word_is_a_prefix_match(self):
+        compiled = self._compile("connection ref")
+        self.assertIn("to_tsquery", str(compiled))
+        self.assertIn("connection <-> ref:*", compiled.params.values())
+
+    def test_single_token_stays_on_substring_search(self):
+        compiled = self._compile("refus")
+        self.assertNotIn("tsquery", str(compiled))
+        self.assertIn("%refus%", compiled.params.values())
@@ -123,5 +123,48 @@ class TestDetectionRules(unittest.TestCase):
         self.assertFalse(any(r["id"] == rule_id for r in rules_after))
 
 
+class TestBatchRuleEvaluation(unittest.IsolatedAsyncioTestCase):
+    def _rule(self, name, priority, threshold):
+        import uuid
+        from app.rules.models import RuleSchema
+
+        return RuleSchema(
+            id=uuid.uuid4(),
+            tenant_id="dev-test-key",
+            name=name,
+            priority=priority,
+            condition={
+                "type": "custom_expression",
+                "parameters": {"field": "duration", "value": threshold},
+            },
+            actions={"create_incident": True},
+            created_at="2026-01-01T00:00:00Z",
+        )
+
+    async def test_batch_matches_per_event_priority_order(self):
+        from unittest.mock import AsyncMock, patch
+
+        rules = (self._rule("severe", 10, 3000), self._rule("slow", 1, 1000))
+        events = [
+            {"tenant_id": "dev-test-key", "duration": 500},
+            {"tenant_id": "dev-test-key", "duration": 1500},
+            {"tenant_id": "dev-test-key", "duration": 3500},
+            {"duration": 5000},  # No tenant: never evaluated
+        ]
+
+        with patch(
+            "app.rules.engine.rule_store.get_rules_for_tenant",
+            AsyncMock(return_value=rules),
+        ) as get_rules:
+            results = await rule_engine.evaluate_events(events)
+
+        self.assertEqual(
+            [r.rule.name if r else None for r in results],
+            [None, "slow", "severe", None],
+        )
+        # One snapshot fetch per tenant, not per event
+        get_rules.assert_awaited_once_with("dev-test-key")
+
+
 if __name__ == "__main__":
     unittest.main()
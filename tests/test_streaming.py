@@ -1,10 +1,12 @@
 import unittest
 import asyncio
+import json
 from fastapi.testclient import TestClient
 from fastapi.websockets import WebSocket
 
 from app.main import app
 from app.api.stream import stream_manager_v2
+from app.stream.stream_manager import StreamManager
 
 
 class TestStreaming(unittest.TestCase):
@@ -50,3 +52,55 @@ class TestStreaming(unittest.TestCase):
 
         # Ensure client got dropped elegantly
         self.assertNotIn(self.tenant_id, stream_manager_v2._clients)
+
+
+class _RecordingSocket:
+    def __init__(self):
+        self.frames = []
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, text):
+        self.frames.append(json.loads(text))
+
+
+class TestGroupedBroadcast(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.manager = StreamManager()
+        self.socket = _RecordingSocket()
+        await self.manager.register_client("tenant-1", self.socket)
+
+    async def asyncTearDown(self):
+        await self.manager.remove_client(self.socket)
+
+    def _event(self, exec_id, timestamp):
+        return {
+            "type": "execution_graph",
+            "timestamp": timestamp,
+            "payload": {"id": exec_id},
+        }
+
+    async def test_single_event_keeps_its_frame_shape(self):
+        event = self._event("exec-1", "2026-02-23T10:00:00Z")
+        await self.manager.broadcast_events("tenant-1", "execution_graph", [event])
+        await asyncio.sleep(0.01)
+
+        self.assertEqual(self.socket.frames, [event])
+
+    async def test_grouped_events_use_a_batch_frame(self):
+        events = [
+            self._event("exec-1", "2026-02-23T10:00:00Z"),
+            self._event("exec-2", "2026-02-23T10:00:01Z"),
+        ]
+        await self.manager.broadcast_events("tenant-1", "execution_graph", events)
+        await asyncio.sleep(0.01)
+
+        self.assertEqual(len(self.socket.frames), 1)
+        frame = self.socket.frames[0]
+        self.assertEqual(frame["type"], "execution_graph_batch")
+        self.assertEqual(frame["payloads"], [{"id": "exec-1"}, {"id": "exec-2"}])
+        self.assertEqual(
+            frame["timestamps"], ["2026-02-23T10:00:00Z", "2026-02-23T10:00:01Z"]
+        )
+        self.assertNotIn("payload", frame)
@@ -9,18 +9,11 @@ from app.api.auth import verify_api_key
 
 
 class MockAsyncResult:
-    def __init__(self, data):
-        self.data = data
+    def __init__(self, rows):
+        self.rows = rows
 
-    def __aiter__(self):
-        self.it = iter(self.data)
-        return self
-
-    async def __anext__(self):
-        try:
-            return next(self.it)
-        except StopIteration:
-            raise StopAsyncIteration
+    def all(self):
+        return list(self.rows)
 
 
 class MockAsyncSession:
@@ -30,13 +23,12 @@ class MockAsyncSession:
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         pass
 
-    async def stream(self, query):
-        # We will dynamically mock DB loops based on query contents mapped globally via patches.
-        # But for test isolation we can return a configurable stream.
-        return self._mock_stream
+    async def execute(self, query):
+        # Aggregation happens inside Postgres, so the mock returns pre-bucketed rows.
+        return self._mock_result
 
-    def set_mock_stream(self, data):
-        self._mock_stream = MockAsyncResult(data)
+    def set_mock_rows(self, rows):
+        self._mock_result = MockAsyncResult(rows)
 
 
 class TestTimeSeriesEngine(unittest.IsolatedAsyncioTestCase):
@@ -53,43 +45,35 @@ class TestTimeSeriesEngine(unittest.IsolatedAsyncioTestCase):
     async def asyncTearDown(self):
         app.dependency_overrides.clear()
 
-    @patch("app.query.timeseries.async_session_maker")
+    @patch("app.query.timeseries.async_read_session_maker")
     async def test_timeseries_bucket_groupings(self, mock_async_session):
         from app.query.timeseries import aggregate_timeseries
-        from app.models.event import Event
+        from types import SimpleNamespace
 
-        # Crafting 3 distinct timestamped events sequentially crossing bounds
-        # Event 1: 00:00:10 (Bucket 00:00:00)
-        # Event 2: 00:00:15 (Bucket 00:00:00) - Error
-        # Event 3: 00:01:05 (Bucket 00:01:00)
+        # Postgres returns one aggregated row per 60s bucket:
+        # Bucket 00:00:00 -> 2 events (100ms, 300ms FAILED)
+        # Bucket 00:01:00 -> 1 event (200ms)
         t_base = datetime(2026, 1, 1, 0, 0, 0, tzinfo=timezone.utc).timestamp()
 
-        events = [
-            (
-                Event(
-                    tenant_id="tenant-metrics",
-                    timestamp=datetime.fromtimestamp(t_base + 10, tz=timezone.utc),
-                    payload={"status": "COMPLETED", "metrics": {"duration_ms": 100.0}},
-                ),
+        rows = [
+            SimpleNamespace(
+                bucket=datetime.fromtimestamp(t_base, tz=timezone.utc),
+                count=2,
+                errors=1,
+                avg_duration=200.0,
+                p95=290.0,
             ),
-            (
-                Event(
-                    tenant_id="tenant-metrics",
-                    timestamp=datetime.fromtimestamp(t_base + 15, tz=timezone.utc),
-                    payload={"status": "FAILED", "metrics": {"duration_ms": 300.0}},
-                ),
-            ),
-            (
-                Event(
-                    tenant_id="tenant-metrics",
-                    timestamp=datetime.fromtimestamp(t_base + 65, tz=timezone.utc),
-                    payload={"status": "COMPLETED", "metrics": {"duration_ms": 200.0}},
-                ),
+            SimpleNamespace(
+                bucket=datetime.fromtimestamp(t_base + 60, tz=timezone.utc),
+                count=1,
+                errors=0,
+                avg_duration=200.0,
+                p95=200.0,
             ),
         ]
 
         mock_session_instance = MockAsyncSession()
-        mock_session_instance.set_mock_stream(events)
+        mock_session_instance.set_mock_rows(rows)
         mock_async_session.return_value = mock_session_instance
 
         # Test 1: Execution Count Metric (60s buckets)
@@ -119,22 +103,17 @@ class TestTimeSeriesEngine(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(res3[0]["value"], 200.0)  # (100+300)/2
         self.assertEqual(res3[1]["value"], 200.0)
 
-    def test_compute_percentile(self):
-        from app.query.timeseries import _compute_percentile
-
-        data = [15.0, 20.0, 35.0, 40.0, 50.0]  # sorted length 5
-
-        # p50 = index 2 = 35.0
-        p50 = _compute_percentile(data, 50)
-        self.assertEqual(p50, 35.0)
-
-        # Empty boundary natively yields zeros dynamically
-        self.assertEqual(_compute_percentile([], 90), 0.0)
+        # Test 4: p95 is surfaced straight from percentile_cont
+        res4 = await aggregate_timeseries(
+            "tenant-metrics", start_t, end_t, 60, "latency_p95"
+        )
+        self.assertEqual(res4[0]["value"], 290.0)
+        self.assertEqual(res4[0]["timestamp"], "2026-01-01T00:00:00+00:00")
 
-    @patch("app.query.timeseries.async_session_maker")
+    @patch("app.query.timeseries.async_read_session_maker")
     def test_metrics_api_endpoint(self, mock_async_session):
         mock_session_instance = MockAsyncSession()
-        mock_session_instance.set_mock_stream(
+        mock_session_instance.set_mock_rows(
             []
         )  # Return empty natively bypassing mock limits
         mock_async_session.return_value = mock_session_instance
@@ -52,15 +52,14 @@ class TestTracesAPI(unittest.IsolatedAsyncioTestCase):
 
     @patch("app.query.traces.async_session_maker")
     def test_get_trace_success(self, mock_async_session):
-        from app.models.event import Event
-
         trace_id = str(uuid.uuid4())
-        mock_event = Event(
-            id=uuid.UUID(trace_id),
-            tenant_id="tenant-traces-test",
-            timestamp=datetime(2026, 1, 1, tzinfo=timezone.utc),
-            payload={"foo": "bar", "status": "COMPLETED"},
-        )
+        # get_trace returns the jsonb_build_object document produced by Postgres
+        mock_event = {
+            "id": trace_id,
+            "timestamp": "2026-01-01T00:00:00+00:00",
+            "tenant_id": "tenant-traces-test",
+            "payload": {"foo": "bar", "status": "COMPLETED"},
+        }
 
         mock_session_instance = MockAsyncSession()
         mock_session_instance.set_mock_result([mock_event])
@@ -101,23 +100,22 @@ class TestTracesAPI(unittest.IsolatedAsyncioTestCase):
 
     @patch("app.query.traces.async_session_maker")
     def test_list_traces(self, mock_async_session):
-        from app.models.event import Event
+        from types import SimpleNamespace
 
         e1_id = uuid.uuid4()
         e2_id = uuid.uuid4()
 
+        # list_traces projects (id, timestamp, status) rows rather than full events
         mock_events = [
-            Event(
+            SimpleNamespace(
                 id=e1_id,
-                tenant_id="tenant-traces-test",
                 timestamp=datetime(2026, 1, 2, tzinfo=timezone.utc),
-                payload={"status": "FAILED"},
+                status="FAILED",
             ),
-            Event(
+            SimpleNamespace(
                 id=e2_id,
-                tenant_id="tenant-traces-test",
                 timestamp=datetime(2026, 1, 1, tzinfo=timezone.utc),
-                payload={"status": "COMPLETED"},
+                status="COMPLETED",
             ),
         ]
 